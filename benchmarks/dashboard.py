@@ -0,0 +1,53 @@
+"""Episodes/sec of `train_qlearning` with the live dashboard attached and detached.
+
+The viewer needs a display; pass `--no-viewer` on headless nodes to measure
+only the cost of pushing into the shared-memory channel.
+
+    python -m benchmarks.dashboard --episodes 200
+"""
+import argparse
+import time
+
+import gymnasium
+
+from dashboard import LiveDashboard
+from hyperparams import SET1
+from python1_rl import train_qlearning
+
+
+def run(env_id, params, dashboard):
+    env = gymnasium.make(env_id, render_mode=None)
+    start = time.perf_counter()
+    train_qlearning(env, **params, run_name="bench_dashboard", dashboard=dashboard)
+    return params["episodes"] / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--env-id", default="blocksworld_env/BlocksWorld-v0")
+    parser.add_argument("--episodes", type=int, default=200)
+    parser.add_argument("--no-viewer", action="store_true")
+    parser.add_argument("--pushes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    params = dict(SET1, episodes=args.episodes)
+    detached = run(args.env_id, params, None)
+    dashboard = LiveDashboard("benchmark", viewer=not args.no_viewer)
+    try:
+        attached = run(args.env_id, params, dashboard)
+
+        # Raw cost of the channel itself, independent of the env
+        start = time.perf_counter()
+        for i in range(args.pushes):
+            dashboard.push(i, -i)
+        push_us = (time.perf_counter() - start) / args.pushes * 1e6
+    finally:
+        dashboard.close()
+
+    print(f"detached: {detached:.1f} episodes/sec")
+    print(f"attached: {attached:.1f} episodes/sec ({attached / detached:.1%} of detached)")
+    print(f"push:     {push_us:.2f} us/episode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Real env steps and wall-clock to an optimal greedy policy: Q-learning vs Dyna-Q.
+
+Runs on BlocksWorldEnvTarget-v0, whose observation includes the target. A
+policy counts as optimal once its greedy rollout from the reset state reaches
+every target in the shortest possible number of moves (BFS over the cached
+transition table). Time spent on that check is excluded from wall-clock.
+
+    python -m benchmarks.dyna_q --planning-steps 20 --max-episodes 3000
+"""
+import argparse
+import time
+
+import gymnasium
+import numpy as np
+
+from dyna_qlearning import train_dyna_q
+from planner import evaluation_tasks, greedy_score
+from hyperparams import SET1, SET2, SET3
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+
+def optimality_check(env):
+    base = env.unwrapped
+    transitions = np.asarray(base.transitions)
+    tasks = evaluation_tasks(base)
+
+    def is_optimal(qtable):
+        return greedy_score(qtable.argmax(axis=1), transitions, tasks) == 1.0
+
+    return is_optimal
+
+
+def run(env, params, planning_steps, prioritized, max_episodes, seed):
+    is_optimal = optimality_check(env)
+    check_time = [0.0]
+    reached = []
+
+    def on_episode(qtable):
+        start = time.perf_counter()
+        optimal = is_optimal(qtable)
+        check_time[0] += time.perf_counter() - start
+        if optimal:
+            reached.append(True)
+        return optimal
+
+    start = time.perf_counter()
+    _, steps = train_dyna_q(
+        env, **dict(params, episodes=max_episodes), planning_steps=planning_steps,
+        prioritized=prioritized, run_name="bench_dyna_q", seed=seed, on_episode=on_episode,
+    )
+    elapsed = time.perf_counter() - start - check_time[0]
+    return bool(reached), sum(steps), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--planning-steps", type=int, default=20)
+    parser.add_argument("--max-episodes", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    env = gymnasium.make(ENV_ID, render_mode=None)
+    agents = [
+        ("Q-learning", 0, False),
+        (f"Dyna-Q (K={args.planning_steps})", args.planning_steps, False),
+        (f"Prioritized sweeping (K={args.planning_steps})", args.planning_steps, True),
+    ]
+    print(f"{'set':<5} {'agent':<34} {'optimal':>8} {'env steps':>10} {'wall (s)':>9}")
+    try:
+        for set_name, params in (("SET1", SET1), ("SET2", SET2), ("SET3", SET3)):
+            for agent, planning_steps, prioritized in agents:
+                optimal, steps, elapsed = run(
+                    env, params, planning_steps, prioritized, args.max_episodes, args.seed
+                )
+                print(
+                    f"{set_name:<5} {agent:<34} {'yes' if optimal else 'no':>8} "
+                    f"{steps:>10} {elapsed:>9.2f}"
+                )
+    finally:
+        env.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Episodes and wall-clock saved by convergence-based early stopping of tabular Q-learning.
+
+Each hyperparameter set trains twice on BlocksWorldEnvTarget-v0 with the same
+episode budget: once to the end, once with a ConvergenceMonitor that stops
+the run when it has converged (or is hopeless). Episodes are capped at
+--max-episode-steps so an unlucky start cannot stall a run.
+
+    python -m benchmarks.early_stopping --budget 2000 --stable-steps 5000
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import gymnasium
+import numpy as np
+
+from convergence import ConvergenceMonitor, compute_saved
+from hyperparams import SET1, SET2, SET3
+from python1_rl import train_qlearning
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+
+def run(params, budget, max_episode_steps, seed, monitor=None):
+    np.random.seed(seed)
+    env = gymnasium.make(ENV_ID, render_mode=None, max_episode_steps=max_episode_steps)
+    env.action_space.seed(seed)
+    env.reset(seed=seed)
+    start = time.perf_counter()
+    # train_qlearning prints every episode; keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        train_qlearning(
+            env, **dict(params, episodes=budget), run_name="bench_early_stopping", monitor=monitor
+        )
+    return time.perf_counter() - start  # train_qlearning closes the env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=2000, help="Episode budget per run")
+    parser.add_argument("--max-episode-steps", type=int, default=200)
+    parser.add_argument("--window", type=int, default=100)
+    parser.add_argument("--success-rate", type=float, default=0.95)
+    parser.add_argument("--stable-steps", type=int, default=5000)
+    parser.add_argument("--q-tol", type=float, default=1e-3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'set':<5} {'stop':>10} {'episodes':>9} {'saved':>7} "
+        f"{'full (s)':>9} {'early (s)':>10} {'time saved':>11}"
+    )
+    for set_name, params in (("SET1", SET1), ("SET2", SET2), ("SET3", SET3)):
+        full = run(params, args.budget, args.max_episode_steps, args.seed)
+        monitor = ConvergenceMonitor(
+            window=args.window, success_rate=args.success_rate,
+            stable_steps=args.stable_steps, q_tol=args.q_tol, give_up_after=args.budget // 2,
+        )
+        early = run(params, args.budget, args.max_episode_steps, args.seed, monitor)
+        saved = compute_saved(monitor.episodes, args.budget)
+        print(
+            f"{set_name:<5} {monitor.stop_reason or 'budget':>10} {monitor.episodes:>9} "
+            f"{saved['saved_fraction']:>7.0%} {full:>9.2f} {early:>10.2f} "
+            f"{1 - early / full:>11.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
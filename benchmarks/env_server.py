@@ -0,0 +1,74 @@
+"""Latency and throughput of env_server.py with 1-256 concurrent clients on localhost.
+
+Starts a server subprocess, then drives it with asyncio clients speaking the
+RemoteEnv wire protocol, each doing `--steps` random steps.
+
+    python -m benchmarks.env_server --clients 1 4 16 64 256
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from blocksworld_env.envs.remote_env import HELLO, REQUEST, REPLY, OP_RESET, OP_STEP, OP_CLOSE
+
+
+async def client(path, steps, seed, latencies):
+    reader, writer = await asyncio.open_unix_connection(path)
+    _, num_actions = HELLO.unpack(await reader.readexactly(HELLO.size))
+    rng = np.random.default_rng(seed)
+    writer.write(REQUEST.pack(OP_RESET, seed))
+    await reader.readexactly(REPLY.size)
+    for action in rng.integers(num_actions, size=steps):
+        start = time.perf_counter()
+        writer.write(REQUEST.pack(OP_STEP, int(action)))
+        _, _, terminated, _ = REPLY.unpack(await reader.readexactly(REPLY.size))
+        latencies.append(time.perf_counter() - start)
+        if terminated:
+            writer.write(REQUEST.pack(OP_RESET, -1))
+            await reader.readexactly(REPLY.size)
+    writer.write(REQUEST.pack(OP_CLOSE, 0))
+    writer.close()
+
+
+async def run(path, clients, steps):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(path, steps, seed, latencies) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, np.percentile(latencies, [50, 99]) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--env", default="blocksworld_env/BlocksWorld-v0")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16, 64, 256])
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    server = subprocess.Popen(
+        [sys.executable, "env_server.py", "--env", args.env, "--unix", path],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        while not os.path.exists(path):
+            if server.poll() is not None:
+                raise RuntimeError("Environment server failed to start")
+            time.sleep(0.05)
+        print(f"{'clients':>7} {'steps/s':>10} {'p50 (us)':>9} {'p99 (us)':>9}")
+        for clients in args.clients:
+            throughput, (p50, p99) = asyncio.run(run(path, clients, args.steps))
+            print(f"{clients:>7} {throughput:>10.0f} {p50:>9.0f} {p99:>9.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""Learning-efficiency suite: tabular Q-learning, DQN and PPO against the optimal plan.
+
+Every (env, agent, seed) job trains headless for a fixed budget of env steps,
+in parallel worker processes. The optimal episode length comes from a BFS
+over the cached transition table (BlocksWorld) or the Manhattan distance
+(GridWorld). Reported per job:
+
+  steps to X%   env steps until the rolling training success rate over the
+                last --window episodes first reaches --success
+  wall (s)      training time, excluding evaluation
+  final regret  mean of (greedy episode length - optimal length) over
+                --eval-episodes fixed-seed episodes; failures count as
+                --max-episode-steps
+
+The tabular agent is python1_rl.train_qlearning with SET1, stopped once
+its env-step budget is spent.
+
+Results are written as JSON and Markdown, tagged with the git commit. Pass
+a previous JSON report as --baseline to add per-row deltas.
+
+    python -m benchmarks.learning_efficiency --seeds 0 1 2 --workers 8
+    python -m benchmarks.learning_efficiency --baseline reports/learning_efficiency_abc1234.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import multiprocessing as mp
+import os
+import random
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import gymnasium
+import numpy as np
+import torch
+from gymnasium import spaces
+from stable_baselines3 import DQN, PPO
+
+from blocksworld_env.envs.space_cache import ENV_SPACES, load_env_spaces
+from planner import distances_to
+from hyperparams import DQN_PARAMS, PPO_PARAMS, SET1
+from python1_rl import train_qlearning
+
+ENVS = {
+    "blocksworld_env/BlocksWorld-v0": {"budget": 20_000},
+    "blocksworld_env/BlocksWorldEnvTarget-v0": {"budget": 50_000},
+    "blocksworld_env/GridWorld-v0": {"budget": 20_000},
+}
+AGENTS = ("qlearning", "dqn", "ppo")
+
+EVAL_SEED = 10_000
+
+
+class EpisodeRecorder(gymnasium.Wrapper):
+    """Counts env steps and records (total steps, success, length, optimal length) per episode."""
+
+    def __init__(self, env, optimal_length):
+        super().__init__(env)
+        self.optimal_length = optimal_length
+        self.total_steps = 0
+        self.length = 0
+        self.optimal = None
+        self.episodes = []
+
+    def reset(self, **kwargs):
+        obs, info = self.env.reset(**kwargs)
+        self.length = 0
+        self.optimal = self.optimal_length(self.env.unwrapped, info)
+        return obs, info
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self.total_steps += 1
+        self.length += 1
+        if terminated or truncated:
+            self.episodes.append((self.total_steps, bool(terminated), self.length, self.optimal))
+        return obs, reward, terminated, truncated, info
+
+
+class GridIndex(gymnasium.ObservationWrapper):
+    # GridWorld's agent/target positions as one Discrete index, for the Q-table
+    def __init__(self, env):
+        super().__init__(env)
+        self.size = env.unwrapped.size
+        self.observation_space = spaces.Discrete(self.size ** 4)
+
+    def observation(self, obs):
+        ax, ay = obs["agent"]
+        tx, ty = obs["target"]
+        return int(((ax * self.size + ay) * self.size + tx) * self.size + ty)
+
+
+def blocks_optimal_length(transitions):
+    transitions = np.asarray(transitions)
+    dist_cache = {}
+
+    def optimal_length(base, info):
+        goal = info["target"]
+        if goal not in dist_cache:
+            dist_cache[goal] = distances_to(transitions, goal)
+        # Episodes only end on a move into the target, so a start on the
+        # target itself still needs a move out and back
+        nxt = transitions[base.state]
+        dist = dist_cache[goal][nxt[nxt >= 0]]
+        dist = dist[dist >= 0]
+        return int(dist.min()) + 1 if dist.size else None
+
+    return optimal_length
+
+
+def grid_optimal_length(base, info):
+    return int(info["distance"])
+
+
+def make_env(env_id, max_episode_steps, tabular):
+    env = gymnasium.make(env_id, render_mode=None, max_episode_steps=max_episode_steps)
+    if env_id.endswith("GridWorld-v0"):
+        env = EpisodeRecorder(env, grid_optimal_length)
+        return (GridIndex(env) if tabular else env), env
+    recorder = EpisodeRecorder(env, blocks_optimal_length(env.unwrapped.transitions))
+    return recorder, recorder
+
+
+def steps_to_success(episodes, success, window):
+    outcomes = np.array([ok for _, ok, _, _ in episodes], dtype=float)
+    if len(outcomes) < window:
+        return None
+    rates = np.convolve(outcomes, np.ones(window) / window, mode="valid")
+    reached = np.flatnonzero(rates >= success)
+    return int(episodes[reached[0] + window - 1][0]) if reached.size else None
+
+
+def train(agent, env, recorder, budget, seed, run_name):
+    # Returns a greedy policy: observation -> action
+    if agent == "qlearning":
+        # Seeded through np.random and env.action_space in run_job. Every episode
+        # takes at least one step, so `budget` episodes always outlast the step
+        # budget; train_qlearning prints every episode
+        with contextlib.redirect_stdout(io.StringIO()):
+            qtable = train_qlearning(
+                env, **dict(SET1, episodes=budget), run_name=run_name,
+                on_episode=lambda q: recorder.total_steps >= budget,
+            )
+        return lambda obs: int(qtable[obs].argmax())
+
+    cls, params = (DQN, DQN_PARAMS) if agent == "dqn" else (PPO, PPO_PARAMS)
+    policy = "MultiInputPolicy" if isinstance(env.observation_space, spaces.Dict) else "MlpPolicy"
+    model = cls(policy, env, seed=seed, verbose=0, **params)
+    model.learn(total_timesteps=budget)
+    return lambda obs: int(model.predict(obs, deterministic=True)[0])
+
+
+def evaluate(env_id, policy, episodes, max_episode_steps, tabular):
+    env, recorder = make_env(env_id, max_episode_steps, tabular)
+    try:
+        for i in range(episodes):
+            random.seed(EVAL_SEED + i)  # the BlocksWorld envs draw targets from `random`
+            obs, info = env.reset(seed=EVAL_SEED + i)
+            done = False
+            while not done:
+                obs, _, terminated, truncated, _ = env.step(policy(obs))
+                done = terminated or truncated
+    finally:
+        env.close()
+    regrets = [
+        (length if ok else max_episode_steps) - optimal
+        for _, ok, length, optimal in recorder.episodes
+        if optimal is not None
+    ]
+    successes = [ok for _, ok, _, _ in recorder.episodes]
+    optimal = [optimal for _, _, _, optimal in recorder.episodes if optimal is not None]
+    return float(np.mean(regrets)), float(np.mean(successes)), float(np.mean(optimal))
+
+
+def run_job(env_id, agent, seed, budget, args):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.set_num_threads(1)  # one core per job; the jobs run in parallel
+
+    tabular = agent == "qlearning"
+    env, recorder = make_env(env_id, args.max_episode_steps, tabular)
+    env.action_space.seed(seed)
+    env.reset(seed=seed)
+    start = time.perf_counter()
+    try:
+        # One log file per job: the jobs run in parallel
+        run_name = f"bench_learning_efficiency_{env_id.split('/')[-1]}_{agent}_{seed}"
+        policy = train(agent, env, recorder, budget, seed, run_name)
+    finally:
+        env.close()
+    wall = time.perf_counter() - start
+
+    regret, eval_success, optimal = evaluate(
+        env_id, policy, args.eval_episodes, args.max_episode_steps, tabular
+    )
+    return {
+        "env": env_id,
+        "agent": agent,
+        "seed": seed,
+        "budget": budget,
+        "env_steps": recorder.total_steps,
+        "episodes": len(recorder.episodes),
+        "steps_to_success": steps_to_success(recorder.episodes, args.success, args.window),
+        "wall_clock": wall,
+        "final_regret": regret,
+        "eval_success_rate": eval_success,
+        "optimal_length": optimal,
+    }
+
+
+def summarize(results):
+    groups = {}
+    for r in results:
+        groups.setdefault((r["env"], r["agent"]), []).append(r)
+    summary = []
+    for (env_id, agent), runs in groups.items():
+        reached = [r["steps_to_success"] for r in runs if r["steps_to_success"] is not None]
+        summary.append({
+            "env": env_id,
+            "agent": agent,
+            "seeds": len(runs),
+            "reached": len(reached),
+            "median_steps_to_success": float(np.median(reached)) if reached else None,
+            "mean_wall_clock": float(np.mean([r["wall_clock"] for r in runs])),
+            "mean_final_regret": float(np.mean([r["final_regret"] for r in runs])),
+            "mean_eval_success_rate": float(np.mean([r["eval_success_rate"] for r in runs])),
+        })
+    return summary
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True).stdout
+        return commit + ("-dirty" if dirty.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def _delta(value, old, spec):
+    if value is None or old is None:
+        return "-"
+    return format(value - old, "+" + spec)
+
+
+def markdown(report, baseline=None):
+    config = report["config"]
+    lines = [
+        "# Learning efficiency",
+        "",
+        f"Commit `{report['commit']}`, {report['date']}. "
+        f"Seeds {config['seeds']}, success {config['success']:.0%} over {config['window']} episodes, "
+        f"{config['eval_episodes']} eval episodes capped at {config['max_episode_steps']} steps.",
+        "",
+    ]
+    header = "| env | agent | budget | reached | steps to X% | wall (s) | final regret | eval success |"
+    rule = "|---|---|---:|---:|---:|---:|---:|---:|"
+    old = {}
+    if baseline is not None:
+        header += " Δ steps | Δ wall | Δ regret |"
+        rule += "---:|---:|---:|"
+        lines.insert(3, f"Deltas against `{baseline['commit']}`.")
+        lines.insert(4, "")
+        old = {(s["env"], s["agent"]): s for s in baseline["summary"]}
+    lines += [header, rule]
+    for s in report["summary"]:
+        row = (
+            f"| {s['env'].split('/')[-1]} | {s['agent']} | {config['budgets'][s['env']]} "
+            f"| {s['reached']}/{s['seeds']} | {_fmt(s['median_steps_to_success'], '.0f')} "
+            f"| {s['mean_wall_clock']:.1f} | {s['mean_final_regret']:.2f} "
+            f"| {s['mean_eval_success_rate']:.0%} |"
+        )
+        if baseline is not None:
+            b = old.get((s["env"], s["agent"]), {})
+            row += (
+                f" {_delta(s['median_steps_to_success'], b.get('median_steps_to_success'), '.0f')} "
+                f"| {_delta(s['mean_wall_clock'], b.get('mean_wall_clock'), '.1f')} "
+                f"| {_delta(s['mean_final_regret'], b.get('mean_final_regret'), '.2f')} |"
+            )
+        lines.append(row)
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envs", nargs="+", choices=sorted(ENVS), default=list(ENVS))
+    parser.add_argument("--agents", nargs="+", choices=AGENTS, default=list(AGENTS))
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiplies every env's step budget")
+    parser.add_argument("--max-episode-steps", type=int, default=200)
+    parser.add_argument("--success", type=float, default=0.8)
+    parser.add_argument("--window", type=int, default=50)
+    parser.add_argument("--eval-episodes", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="Parallel jobs (default: CPU count)")
+    parser.add_argument("--output", default="./reports", help="Directory for the JSON and Markdown reports")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    budgets = {env_id: int(ENVS[env_id]["budget"] * args.budget_scale) for env_id in args.envs}
+    jobs = [(e, a, s) for e in args.envs for a in args.agents for s in args.seeds]
+
+    # Headless everywhere; build the space caches once, before the workers
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    for env_id in args.envs:
+        if env_id in ENV_SPACES:
+            load_env_spaces(env_id)
+    # Fork where possible so training modules are not re-imported per job
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+        futures = [pool.submit(run_job, e, a, s, budgets[e], args) for e, a, s in jobs]
+        results = []
+        for (env_id, agent, seed), future in zip(jobs, futures):
+            results.append(future.result())
+            print(f"done: {env_id} {agent} seed={seed}")
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "seeds": args.seeds,
+            "budgets": budgets,
+            "max_episode_steps": args.max_episode_steps,
+            "success": args.success,
+            "window": args.window,
+            "eval_episodes": args.eval_episodes,
+            "qlearning": SET1,
+            "dqn": DQN_PARAMS,
+            "ppo": PPO_PARAMS,
+        },
+        "results": results,
+        "summary": summarize(results),
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"learning_efficiency_{commit}")
+    with open(path + ".json", "w") as f:
+        json.dump(report, f, indent=2)
+    text = markdown(report, baseline)
+    with open(path + ".md", "w") as f:
+        f.write(text)
+    print(text)
+    print(f"Saved {path}.json and {path}.md")
+
+
+if __name__ == "__main__":
+    main()
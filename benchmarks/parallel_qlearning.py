@@ -0,0 +1,57 @@
+"""Scaling of the Hogwild tabular trainer across worker counts.
+
+For each worker count the same total episode budget is split across the
+workers. Reports updates/sec and the wall-clock time until the greedy policy
+of the shared Q-table is optimal: from the reset configuration it reaches
+every target along a shortest path (planner.greedy_score of 1.0). That needs
+the target in the observation, so the default env is BlocksWorldEnvTarget-v0.
+
+    python -m benchmarks.parallel_qlearning --workers 1 2 4 8 16
+"""
+import argparse
+
+import gymnasium
+import numpy as np
+
+import blocksworld_env  # noqa: F401
+from parallel_qlearning import PARAMS, train_parallel_qlearning
+from planner import evaluation_tasks, greedy_score
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--env-id", default=ENV_ID, help="A BlocksWorldEnvTarget env")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--total-episodes", type=int, default=2000)
+    args = parser.parse_args()
+
+    env = gymnasium.make(args.env_id, render_mode=None)
+    transitions = np.asarray(env.unwrapped.transitions)
+    tasks = evaluation_tasks(env.unwrapped)
+    env.close()
+
+    params = dict(PARAMS)
+    print(f"{'workers':>7} {'episodes':>8} {'updates/s':>10} {'converged (s)':>14} {'total (s)':>10}")
+    for workers in args.workers:
+        params["episodes"] = max(1, args.total_episodes // workers)
+        converged_at = []
+
+        def on_episode(history, qtable):
+            if greedy_score(qtable.argmax(axis=1), transitions, tasks) == 1.0:
+                converged_at.append(len(history))
+                return True
+            return False
+
+        qtable, history, elapsed = train_parallel_qlearning(
+            args.env_id, workers, **params, run_name=f"bench_parallel_{workers}",
+            on_episode=on_episode,
+        )
+        updates = sum(steps for _, steps, _ in history)
+        converged = f"{elapsed:.2f}" if converged_at else "-"
+        print(f"{workers:>7} {len(history):>8} {updates / elapsed:>10.0f} {converged:>14} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Time to a target greedy score: population-based training vs the best static set.
+
+Both runs get the same compute: PBT trains --population members for
+--generations intervals, the static run trains the three hand-written sets
+(SET1-SET3 for Q-learning, the script constants with two variants for
+DQN/PPO) without exploit/explore for population * generations / 3
+intervals each. Compute is compared in member intervals and env steps; the
+static run can use at most three worker processes, so its wall-clock is
+only comparable on a three-core budget.
+
+    python -m benchmarks.pbt --population 8 --generations 20 --target 1.0
+    python -m benchmarks.pbt --algo PPO --interval 4096 --target 0.9
+"""
+import argparse
+
+import numpy as np
+
+from pbt import explore, run_pbt
+from hyperparams import DQN_PARAMS, PPO_PARAMS, SET1, SET2, SET3
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+STATIC_SETS = {
+    None: {"SET1": SET1, "SET2": SET2, "SET3": SET3},
+    "DQN": {
+        "script": {k: DQN_PARAMS[k] for k in ("learning_rate", "gamma", "exploration_final_eps")},
+        "low lr": {"learning_rate": 1e-4, "gamma": 0.98, "exploration_final_eps": 0.02},
+        "high lr": {"learning_rate": 1e-3, "gamma": 0.95, "exploration_final_eps": 0.05},
+    },
+    "PPO": {
+        "script": {k: PPO_PARAMS[k] for k in ("learning_rate", "gamma", "ent_coef")},
+        "low lr": {"learning_rate": 1e-4, "gamma": 0.98, "ent_coef": 0.01},
+        "high lr": {"learning_rate": 1e-3, "gamma": 0.95, "ent_coef": 0.02},
+    },
+}
+
+
+def describe(name, result, names=None):
+    reached = result["reached"]
+    best = result["best"]
+    label = names[best] if names else f"member {best}"
+    if reached is None:
+        at = f"{'-':>10} {'-':>9} {'-':>12}"
+    else:
+        generation, seconds, steps = reached
+        at = f"{generation:>10} {seconds:>9.1f} {steps:>12}"
+    return f"{name:<8} {at} {result['scores'][best]:>11.3f} {result['env_steps']:>12}  {label}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--algo", choices=["DQN", "PPO"], default=None, help="Default: tabular Q-learning")
+    parser.add_argument("--population", type=int, default=8)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--interval", type=int, default=50, help="Episodes (tabular) or timesteps (SB3)")
+    parser.add_argument("--target", type=float, default=1.0, help="Greedy score to reach (1.0: optimal)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    static = STATIC_SETS[args.algo]
+    rng = np.random.default_rng(args.seed)
+    sets = list(static.values())
+    population = [
+        sets[i] if i < len(sets) else explore(sets[i % len(sets)], rng) for i in range(args.population)
+    ]
+    common = dict(
+        env_id=ENV_ID, algo=args.algo, workers=args.workers, target=args.target, seed=args.seed,
+    )
+
+    print(
+        f"{'run':<8} {'gen@target':>10} {'wall (s)':>9} {'steps@target':>12} "
+        f"{'final score':>11} {'env steps':>12}  best"
+    )
+    pbt = run_pbt(
+        population, args.generations, args.interval, run_name="bench_pbt",
+        checkpoint_dir="./models/bench_pbt", **common,
+    )
+    print(describe("PBT", pbt))
+
+    # Equal compute: the same number of member intervals, split over the static sets
+    generations = max(1, args.population * args.generations // len(sets))
+    baseline = run_pbt(
+        sets, generations, args.interval, exploit=False, run_name="bench_pbt_static",
+        checkpoint_dir="./models/bench_pbt_static", **common,
+    )
+    print(describe("static", baseline, list(static)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Load time and per-call `predict` latency: SB3 model vs exported TablePolicy.
+
+Needs the saved models and their tables (run export_policy_table.py first).
+
+    python -m benchmarks.policy_table --calls 10000
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from table_policy import MODELS, TablePolicy
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def import_seconds(module):
+    # In a fresh interpreter, so modules this process already loaded don't hide the cost
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def per_call_us(policy, observations):
+    start = time.perf_counter()
+    for obs in observations:
+        policy.predict(obs, deterministic=True)
+    return (time.perf_counter() - start) / len(observations) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # Import time of torch/SB3 is part of what the table saves
+    sb3_import = import_seconds("stable_baselines3")
+    table_import = import_seconds("table_policy")
+    from stable_baselines3 import DQN, PPO
+
+    print(f"import: stable_baselines3 {sb3_import * 1e3:.1f} ms -> table_policy {table_import * 1e3:.1f} ms")
+    for name, (model_path, table_path) in MODELS.items():
+        cls = DQN if name == "dqn" else PPO
+        model, model_load = timed(lambda: cls.load(model_path, device="cpu"))
+        table, table_load = timed(lambda: TablePolicy.load(table_path))
+
+        observations = np.random.default_rng(0).integers(
+            model.observation_space.n, size=args.calls
+        )
+        model_us = per_call_us(model, observations)
+        table_us = per_call_us(table, observations)
+        print(
+            f"{name}: load {model_load * 1e3:.1f} ms -> {table_load * 1e3:.2f} ms, "
+            f"predict {model_us:.1f} us -> {table_us:.2f} us ({model_us / table_us:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
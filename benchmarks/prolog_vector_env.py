@@ -0,0 +1,60 @@
+"""Batch-step throughput of the Prolog-backed envs: SyncVectorEnv vs PrologVectorEnv.
+
+Both vector envs hold the same number of BlocksWorld sub-envs, each with its
+own swipl process, and are driven with the same random actions. Construction
+time (starting swipl) is reported separately from stepping.
+
+    python -m benchmarks.prolog_vector_env --num-envs 1 2 4 8 16 --steps 2000
+"""
+import argparse
+import time
+
+import gymnasium
+import numpy as np
+
+import blocksworld_env  # noqa: F401
+from blocksworld_env.envs.prolog_vector_env import make_prolog_vec
+from blocksworld_env.envs.space_cache import ENV_SPACES, load_env_spaces
+
+
+def measure(make, steps, seed):
+    start = time.perf_counter()
+    vec_env = make()
+    startup = time.perf_counter() - start
+    try:
+        vec_env.reset(seed=seed)
+        rng = np.random.default_rng(seed)
+        actions = rng.integers(vec_env.single_action_space.n, size=(steps, vec_env.num_envs))
+        start = time.perf_counter()
+        for batch in actions:
+            vec_env.step(batch)
+        elapsed = time.perf_counter() - start
+    finally:
+        vec_env.close()
+    return startup, steps * vec_env.num_envs / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--env", choices=sorted(ENV_SPACES), default="blocksworld_env/BlocksWorld-v0")
+    parser.add_argument("--num-envs", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--steps", type=int, default=2000, help="Batch steps per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    load_env_spaces(args.env)  # build the space cache once, outside the timings
+    print(f"{'vector env':<16} {'envs':>5} {'startup (s)':>12} {'env steps/s':>12} {'speedup':>8}")
+    for n in args.num_envs:
+        cases = [
+            ("SyncVectorEnv", lambda: gymnasium.make_vec(args.env, num_envs=n, vectorization_mode="sync")),
+            ("PrologVectorEnv", lambda: make_prolog_vec(args.env, n)),
+        ]
+        baseline = None
+        for name, make in cases:
+            startup, throughput = measure(make, args.steps, args.seed)
+            baseline = baseline or throughput
+            print(f"{name:<16} {n:>5} {startup:>12.2f} {throughput:>12.0f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Steps/sec of a random agent with human rendering off, on, throttled and recording.
+
+Uses SDL's dummy video driver unless `--window` is given, so it also runs
+headless. Recording needs the optional `video` extra (imageio).
+
+    python -m benchmarks.render --steps 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import gymnasium
+
+import blocksworld_env  # noqa: F401
+
+ENV_ID = "blocksworld_env/BlocksWorld-v0"
+
+
+def steps_per_sec(steps, **env_kwargs):
+    env = gymnasium.make(ENV_ID, **env_kwargs)
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            env.reset()
+        env.render()
+    elapsed = time.perf_counter() - start
+    env.close()
+    return steps / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--window", action="store_true", help="Use a real window")
+    parser.add_argument("--record", action="store_true", help="Also measure video recording")
+    args = parser.parse_args()
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    configs = [
+        ("rendering off", {"render_mode": None}),
+        ("human, every step", {"render_mode": "human"}),
+        ("human, 30 fps cap", {"render_mode": "human", "render_fps": 30}),
+        ("human, frame_skip=10", {"render_mode": "human", "frame_skip": 10}),
+    ]
+    if args.record:
+        video = os.path.join(tempfile.mkdtemp(), "run.mp4")
+        configs.append(
+            ("human, 30 fps + video", {"render_mode": "human", "render_fps": 30, "record_path": video})
+        )
+
+    baseline = None
+    for name, kwargs in configs:
+        rate = steps_per_sec(args.steps, **kwargs)
+        baseline = baseline or rate
+        print(f"{name:<24} {rate:>9.0f} steps/sec ({rate / baseline:.0%} of rendering off)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-worker RSS and spawn time of SubprocVecEnv over the Prolog-backed envs.
+
+The parent builds the space cache once. Each worker then maps the read-only
+cache files ("shared"). The "private copy" mode rebuilds the per-process
+state dicts and an in-memory transition table in every worker, as the envs
+used to, for comparison. RSS is read from /proc (Linux only); the workers'
+swipl child processes are not included.
+
+    python -m benchmarks.shared_spaces --workers 8 16 32 64
+"""
+import argparse
+import time
+
+import gymnasium
+import numpy as np
+from stable_baselines3.common.vec_env import SubprocVecEnv
+
+import blocksworld_env  # noqa: F401
+from blocksworld_env.envs.space_cache import load_env_spaces
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+
+def shared_env():
+    return gymnasium.make(ENV_ID, render_mode=None)
+
+
+def private_copy_env():
+    env = gymnasium.make(ENV_ID, render_mode=None)
+    base = env.unwrapped
+    base.states_dict = {s: i for i, s in enumerate(base.spaces.states.tolist())}
+    base.inv_states_dict = {i: s for s, i in base.states_dict.items()}
+    base.transitions = np.array(base.transitions)
+    return env
+
+
+def rss_kib(pid):
+    fields = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "RssAnon", "RssFile"):
+                fields[key] = int(value.split()[0])
+    return fields
+
+
+def measure(factory, workers):
+    start = time.perf_counter()
+    vec_env = SubprocVecEnv([factory] * workers)
+    spawn = time.perf_counter() - start
+    vec_env.reset()
+    rss = [rss_kib(p.pid) for p in vec_env.processes]
+    vec_env.close()
+    return spawn, {key: np.mean([r[key] for r in rss]) / 1024 for key in rss[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[8, 16, 32, 64])
+    args = parser.parse_args()
+
+    load_env_spaces(ENV_ID)  # publish once, in the parent
+    print(f"{'mode':<13} {'workers':>7} {'spawn (s)':>9} {'RSS MiB':>8} {'anon MiB':>9} {'file MiB':>9}")
+    for workers in args.workers:
+        for mode, factory in (("shared", shared_env), ("private copy", private_copy_env)):
+            spawn, rss = measure(factory, workers)
+            print(
+                f"{mode:<13} {workers:>7} {spawn:>9.2f} {rss['VmRSS']:>8.1f} "
+                f"{rss.get('RssAnon', 0):>9.1f} {rss.get('RssFile', 0):>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Cold vs warm `gymnasium.make` time for the Prolog-backed envs.
+
+Run from the repository root (the envs load their .pl files and images from
+the working directory):
+
+    python -m benchmarks.startup_cache --repeats 5
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import gymnasium
+import blocksworld_env  # noqa: F401
+
+ENV_IDS = ["blocksworld_env/BlocksWorld-v0", "blocksworld_env/BlocksWorldEnvTarget-v0"]
+
+
+def time_make(env_id):
+    start = time.perf_counter()
+    env = gymnasium.make(env_id, render_mode=None)
+    elapsed = time.perf_counter() - start
+    env.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for env_id in ENV_IDS:
+        cold, warm = [], []
+        for _ in range(args.repeats):
+            # A fresh cache dir per repeat forces the Prolog enumeration
+            with tempfile.TemporaryDirectory() as cache:
+                os.environ["BLOCKSWORLD_CACHE_DIR"] = cache
+                cold.append(time_make(env_id))
+                warm.append(time_make(env_id))
+        print(
+            f"{env_id}: cold {min(cold) * 1e3:.1f} ms, warm {min(warm) * 1e3:.1f} ms "
+            f"(best of {args.repeats}, speedup {min(cold) / min(warm):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
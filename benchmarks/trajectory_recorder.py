@@ -0,0 +1,75 @@
+"""Per-step overhead and bytes per transition of TrajectoryRecorder.
+
+Drives the same random actions through each Prolog-backed env with and
+without the recorder, then re-simulates the recording with the transition
+table as replay_trajectory.py does.
+
+    python -m benchmarks.trajectory_recorder --steps 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import gymnasium
+import numpy as np
+
+import blocksworld_env  # noqa: F401
+from blocksworld_env.envs.space_cache import ENV_SPACES, load_env_spaces
+from blocksworld_env.wrappers import TrajectoryRecorder, load_trajectories
+from blocksworld_env.wrappers.trajectory_recorder import episode_bounds
+from replay_trajectory import check_episode
+
+
+def run(env, actions):
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    env.close()
+    return elapsed / len(actions) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    print(
+        f"{'env':<24} {'plain us/step':>13} {'recorded us/step':>16} {'overhead us':>11} "
+        f"{'bytes/step':>10} {'replay us/step':>14}"
+    )
+    for env_id in sorted(ENV_SPACES):
+        make = lambda: gymnasium.make(env_id, render_mode=None, max_episode_steps=200)
+        spaces_data = load_env_spaces(env_id)
+        transitions = np.asarray(spaces_data.transitions)
+        rng = np.random.default_rng(0)
+        actions = rng.integers(len(spaces_data.actions), size=args.steps).tolist()
+        plain = run(make(), actions)
+
+        with tempfile.TemporaryDirectory() as path:
+            recorded = run(TrajectoryRecorder(make(), path, chunk_size=args.chunk_size), actions)
+            trajectories = load_trajectories(path)
+            on_disk = sum(
+                os.path.getsize(os.path.join(path, name))
+                for name in os.listdir(path)
+                if name.endswith(".bin")
+            )
+            start = time.perf_counter()
+            for first, stop in episode_bounds(trajectories):
+                check_episode(transitions, trajectories, first, stop)
+            replay = (time.perf_counter() - start) / len(trajectories.flags) * 1e6
+            del trajectories
+
+        print(
+            f"{env_id.split('/')[-1]:<24} {plain:>13.1f} {recorded:>16.1f} {recorded - plain:>11.2f} "
+            f"{on_disk / args.steps:>10.1f} {replay:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
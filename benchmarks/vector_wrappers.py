@@ -0,0 +1,89 @@
+"""Wrapper overhead per batch step: per-env scalar wrappers vs the vector wrappers.
+
+Times only the wrapper transforms on a batch of `--num-envs` synthetic
+transitions, using GridWorld-v0 envs to construct the wrappers.
+
+    python -m benchmarks.vector_wrappers --num-envs 1024
+"""
+import argparse
+import time
+
+import gymnasium
+import numpy as np
+
+import blocksworld_env  # noqa: F401
+from blocksworld_env.wrappers import ClipReward, DiscreteActions, RelativePosition, ReacherRewardWrapper
+from blocksworld_env.wrappers.vector_clip_reward import VectorClipReward
+from blocksworld_env.wrappers.vector_discrete_actions import VectorDiscreteActions
+from blocksworld_env.wrappers.vector_reacher_weighted_reward import VectorReacherRewardWrapper
+from blocksworld_env.wrappers.vector_relative_position import VectorRelativePosition
+
+ENV_ID = "blocksworld_env/GridWorld-v0"
+DISC_TO_CONT = [np.array([1.0, 0.0]), np.array([0.0, 1.0]), np.array([-1.0, 0.0]), np.array([0.0, -1.0])]
+
+
+def per_batch_us(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-envs", type=int, default=1024)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    n = args.num_envs
+
+    rng = np.random.default_rng(0)
+    rewards = rng.normal(size=n)
+    actions = rng.integers(len(DISC_TO_CONT), size=n)
+    observations = {
+        "agent": rng.integers(5, size=(n, 2)),
+        "target": rng.integers(5, size=(n, 2)),
+    }
+    infos = {"reward_dist": rng.normal(size=n), "reward_ctrl": rng.normal(size=n)}
+
+    env = gymnasium.make(ENV_ID)
+    vec_env = gymnasium.make_vec(ENV_ID, num_envs=n, vectorization_mode="sync")
+
+    clip, vclip = ClipReward(env, -0.5, 0.5), VectorClipReward(vec_env, -0.5, 0.5)
+    disc, vdisc = DiscreteActions(env, DISC_TO_CONT), VectorDiscreteActions(vec_env, DISC_TO_CONT)
+    rel, vrel = RelativePosition(env), VectorRelativePosition(vec_env)
+    reach, vreach = ReacherRewardWrapper(env, 1.0, 0.1), VectorReacherRewardWrapper(vec_env, 1.0, 0.1)
+
+    cases = [
+        ("ClipReward", lambda: [clip.reward(r) for r in rewards], lambda: vclip.rewards(rewards)),
+        ("DiscreteActions", lambda: [disc.action(a) for a in actions], lambda: vdisc.actions(actions)),
+        (
+            "RelativePosition",
+            lambda: [
+                rel.observation({"agent": observations["agent"][i], "target": observations["target"][i]})
+                for i in range(n)
+            ],
+            lambda: vrel.observations(observations),
+        ),
+        (
+            "ReacherRewardWrapper",
+            lambda: [
+                reach.weighted_reward({"reward_dist": infos["reward_dist"][i], "reward_ctrl": infos["reward_ctrl"][i]})
+                for i in range(n)
+            ],
+            lambda: vreach.weighted_rewards(infos),
+        ),
+    ]
+
+    print(f"N = {n}")
+    print(f"{'wrapper':<22} {'per-env (us)':>13} {'vector (us)':>12} {'speedup':>8}")
+    for name, scalar, vector in cases:
+        scalar_us = per_batch_us(scalar, max(1, args.repeats // 10))
+        vector_us = per_batch_us(vector, args.repeats)
+        print(f"{name:<22} {scalar_us:>13.1f} {vector_us:>12.1f} {scalar_us / vector_us:>7.0f}x")
+
+    vec_env.close()
+    env.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Timesteps and wall-clock to a fixed success rate, with and without the planner warm start.
+
+Trains DQN and PPO on BlocksWorldEnvTarget-v0 (the target is part of the
+observation). Every `--eval-freq` timesteps the greedy policy is rolled out
+from the reset configuration to every target through the cached transition
+table; training stops once the success rate reaches `--success`.
+
+    python -m benchmarks.warm_start --success 0.9
+"""
+import argparse
+import time
+
+import gymnasium
+import numpy as np
+from stable_baselines3 import DQN, PPO
+from stable_baselines3.common.callbacks import BaseCallback
+
+from hyperparams import DQN_PARAMS, PPO_PARAMS
+from planner import evaluation_tasks, generate_demonstrations, greedy_lengths
+from pretrain import behaviour_clone, prefill_replay_buffer
+
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+
+class SuccessRateCallback(BaseCallback):
+    def __init__(self, env, success, eval_freq):
+        super().__init__()
+        base = env.unwrapped
+        self.transitions = np.asarray(base.transitions)
+        self.tasks = evaluation_tasks(base)
+        self.success = success
+        self.eval_freq = eval_freq
+        self.reached_at = None
+
+    def success_rate(self):
+        # Targets the greedy policy reaches within twice their optimal length
+        states = np.arange(len(self.transitions))
+        greedy = self.model.predict(states, deterministic=True)[0]
+        return (greedy_lengths(greedy, self.transitions, self.tasks) > 0).mean()
+
+    def _on_step(self):
+        if self.n_calls % self.eval_freq == 0 and self.success_rate() >= self.success:
+            self.reached_at = self.num_timesteps
+            return False
+        return True
+
+
+def run(algo, warm_start, args):
+    env = gymnasium.make(ENV_ID, render_mode=None, max_episode_steps=100)
+    cls, params = (DQN, DQN_PARAMS) if algo == "DQN" else (PPO, PPO_PARAMS)
+    model = cls("MlpPolicy", env, seed=args.seed, **params)
+    callback = SuccessRateCallback(env, args.success, args.eval_freq)
+
+    start = time.perf_counter()
+    if warm_start:
+        demos = generate_demonstrations(ENV_ID, args.demo_pairs, seed=args.seed)
+        behaviour_clone(model, demos)
+        if algo == "DQN":
+            prefill_replay_buffer(model, demos)
+    callback.init_callback(model)
+    if callback.success_rate() >= args.success:
+        callback.reached_at = 0
+    else:
+        model.learn(total_timesteps=args.budget, callback=callback)
+    elapsed = time.perf_counter() - start
+    env.close()
+    return callback.reached_at, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--success", type=float, default=0.9)
+    parser.add_argument("--budget", type=int, default=100_000)
+    parser.add_argument("--eval-freq", type=int, default=1000)
+    parser.add_argument("--demo-pairs", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'agent':<6} {'warm start':>10} {'timesteps':>10} {'wall (s)':>9}")
+    for algo in ("DQN", "PPO"):
+        for warm_start in (False, True):
+            reached_at, elapsed = run(algo, warm_start, args)
+            timesteps = "-" if reached_at is None else reached_at
+            print(f"{algo:<6} {'yes' if warm_start else 'no':>10} {timesteps:>10} {elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
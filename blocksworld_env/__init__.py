@@ -13,4 +13,9 @@ register(
 register(
     id="blocksworld_env/BlocksWorldEnvTarget-v0",
     entry_point="blocksworld_env.envs:BlocksWorldEnvTarget",
-)
\ No newline at end of file
+)
+
+register(
+    id="blocksworld_env/Remote-v0",
+    entry_point="blocksworld_env.envs:RemoteEnv",
+)
@@ -1,3 +1,4 @@
 from blocksworld_env.envs.grid_world import GridWorldEnv
 from blocksworld_env.envs.blocks_world import BlocksWorldEnv
-from blocksworld_env.envs.blocks_world_target import BlocksWorldEnvTarget
\ No newline at end of file
+from blocksworld_env.envs.blocks_world_target import BlocksWorldEnvTarget
+from blocksworld_env.envs.remote_env import RemoteEnv
@@ -3,13 +3,14 @@ import gymnasium as gym
 from gymnasium import spaces
 from screen import Display
 from swiplserver import PrologMQI, PrologThread
+from blocksworld_env.envs.space_cache import StateIndex, load_spaces
 import random
 
 class BlocksWorldEnv(gym.Env):
     RENDER_FPS = 60  # Frames per second for rendering
     metadata = {"render_modes": ["human"], "render_fps": RENDER_FPS}
 
-    def __init__(self, render_mode=None):
+    def __init__(self, render_mode=None, render_fps=None, frame_skip=1, record_path=None):
         super().__init__()
 
         # a. Start PrologMQI and load blocks_world.pl
@@ -20,47 +21,36 @@ class BlocksWorldEnv(gym.Env):
         if not result:
             raise RuntimeError("Failed to load blocks_world.pl")
         
-        # b. Get all states and build state -> int mapping/ Prolog State -> index
-        self.states_dict = {}
-        state_results = self.prolog_thread.query('state(State)')
-        for i, item in enumerate(state_results):
-            self.states_dict[item['State']] = i
-        self.inv_states_dict = {v: k for k, v in self.states_dict.items()}
-
-        # Print states dict for debugging
-        # print("States Dictionary:", self.states_dict)
-
-        # c. Create action dictionary: int -> Prolog action string
-        self.actions_dict = {}
-        result = self.prolog_thread.query("action(A)")
-        # result is like: [{'A': {'args': ['a', 'b', 'c'], 'functor': 'move'}},...]
-        for i, A in enumerate(result):
-            action_string = A['A']['functor']
-            first = True
-            for arg in A['A']['args']:
-                if first:
-                    first = False
-                    action_string += '('
-                else:
-                    action_string += ','
-                action_string += str(arg)
-            action_string += ')'
-            self.actions_dict[i] = action_string  # maps index to action string
-        # Print actions dict for debugging
-        # print("Actions Dictionary:", self.actions_dict)
+        # b. Load states, actions and the transition table. They are cached on
+        # disk keyed by the rule file hash, so Prolog only enumerates them once
+        self.spaces = load_spaces("blocks_world", prolog_thread=self.prolog_thread)
+        self.transitions = self.spaces.transitions
+
+        # c. Prolog State <-> index over the shared, read-only cached arrays
+        # (no per-process dicts, see StateIndex), and index -> Prolog action string
+        self.states_dict = StateIndex(self.spaces.states, self.spaces.state_order)
+        self.inv_states_dict = self.spaces.states
+        self.actions_dict = dict(enumerate(self.spaces.actions.tolist()))
         
         # d. Define observation and action space
         self.observation_space = spaces.Discrete(len(self.states_dict))
         self.action_space = spaces.Discrete(len(self.actions_dict))
 
         # e. Initial state and target
-        self.state = list(self.states_dict.values())[0]
-        self.target = list(self.states_dict.values())[1]
+        self.state = 0
+        self.target = 1
         
-        # f. Render mode
+        # f. Render mode. render_fps caps the redraw rate and frame_skip draws
+        # every n-th render() call, so watching costs the learner little;
+        # record_path streams the drawn frames to a video file
         self.render_mode = render_mode
+        self.display_options = {
+            "max_fps": render_fps,
+            "frame_skip": frame_skip,
+            "record_path": record_path,
+        }
         if self.render_mode == "human":
-            self.display = Display()
+            self.display = Display(**self.display_options)
         else:
             self.display = None
 
@@ -78,7 +68,7 @@ class BlocksWorldEnv(gym.Env):
         self.state = self.states_dict[state_str]
 
         # d. Optional: randomly pick a new goal state
-        self.target = random.choice(list(self.states_dict.values()))
+        self.target = random.randrange(len(self.states_dict))
 
         # e. Return initial observation and info dict (optional goal state)
         return self.state, {"target": self.target}
@@ -118,13 +108,12 @@ class BlocksWorldEnv(gym.Env):
             return
         
         if not hasattr(self, 'display') or self.display is None:
-            self.display = Display()
+            self.display = Display(**self.display_options)
         
         if self.display.screen is None:
-            self.display.__init__()  # re-init pygame display
+            self.display.__init__(**self.display_options)  # re-init pygame display
 
         # draw current state
-        self.display.draw(self.inv_states_dict[self.state])  # pass current state string
         self.display.target = self.inv_states_dict[self.target]
         self.display.step(self.inv_states_dict[self.state])
 
@@ -3,13 +3,14 @@ import gymnasium as gym
 from gymnasium import spaces
 from screen import Display
 from swiplserver import PrologMQI, PrologThread
+from blocksworld_env.envs.space_cache import StateIndex, load_spaces
 import random
 
 class BlocksWorldEnvTarget(gym.Env):
     RENDER_FPS = 60  # Frames per second for rendering
     metadata = {"render_modes": ["human"], "render_fps": RENDER_FPS}
 
-    def __init__(self, render_mode=None):
+    def __init__(self, render_mode=None, render_fps=None, frame_skip=1, record_path=None):
         super().__init__()
 
         # a. Start PrologMQI and load blocks_world_with_target.pl
@@ -20,47 +21,41 @@ class BlocksWorldEnvTarget(gym.Env):
         if not result:
             raise RuntimeError("Failed to load blocks_world_with_target.pl")
 
-        # b. Get all states and build state -> int mapping/ Prolog State -> index
-        self.states_dict = {}
-        state_results = self.prolog_thread.query('state(State)')
-        for i, item in enumerate(state_results):
-            self.states_dict[item['State']] = i
-        self.inv_states_dict = {v: k for k, v in self.states_dict.items()}
-
-        # Print states dict for debugging
-        print("States Dictionary:", self.states_dict)
-
-        # c. Create action dictionary: int -> Prolog action string
-        self.actions_dict = {}
-        result = self.prolog_thread.query("action(A)")
-        # result is like: [{'A': {'args': ['a', 'b', 'c'], 'functor': 'move'}},...]
-        for i, A in enumerate(result):
-            action_string = A['A']['functor']
-            first = True
-            for arg in A['A']['args']:
-                if first:
-                    first = False
-                    action_string += '('
-                else:
-                    action_string += ','
-                action_string += str(arg)
-            action_string += ')'
-            self.actions_dict[i] = action_string  # maps index to action string
-        # Print actions dict for debugging
-        print("Actions Dictionary:", self.actions_dict)
+        # b. Load states, actions and the transition table. They are cached on
+        # disk keyed by the rule file hash, so Prolog only enumerates them once
+        self.spaces = load_spaces(
+            "blocks_world_with_target",
+            agent_goal="state_helper(State)",
+            prolog_thread=self.prolog_thread,
+        )
+        self.transitions = self.spaces.transitions
+
+        # c. Prolog State <-> index over the shared, read-only cached arrays
+        # (no per-process dicts, see StateIndex), and index -> Prolog action string
+        self.states_dict = StateIndex(self.spaces.states, self.spaces.state_order)
+        self.inv_states_dict = self.spaces.states
+        self.actions_dict = dict(enumerate(self.spaces.actions.tolist()))
+        self.agent_states = self.spaces.agent_states.tolist()
         
         # d. Define observation and action space
         self.observation_space = spaces.Discrete(len(self.states_dict))
         self.action_space = spaces.Discrete(len(self.actions_dict))
 
         # e. Initial state and target
-        self.state = list(self.states_dict.values())[0]
-        self.target = list(self.states_dict.values())[1]
+        self.state = 0
+        self.target = 1
         
-        # f. Render mode
+        # f. Render mode. render_fps caps the redraw rate and frame_skip draws
+        # every n-th render() call, so watching costs the learner little;
+        # record_path streams the drawn frames to a video file
         self.render_mode = render_mode
+        self.display_options = {
+            "max_fps": render_fps,
+            "frame_skip": frame_skip,
+            "record_path": record_path,
+        }
         if self.render_mode == "human":
-            self.display = Display()
+            self.display = Display(**self.display_options)
         else:
             self.display = None
 
@@ -75,16 +70,15 @@ class BlocksWorldEnvTarget(gym.Env):
         agent_state_str = result[0]['State']
 
         # c. Randomly pick a 3-digit target (from state_helper states)
-        target_state_str = random.choice([
-            state[:3] for state in self.states_dict.keys()
-        ])
+        target_state_str = random.choice(self.agent_states)
         
 
     
         # d. Create the 6-digit state
         full_state_str = agent_state_str + target_state_str
         self.state = self.states_dict[full_state_str]
-        self.target = self.states_dict[full_state_str]  # keep it consistent
+        # The goal is the state where the agent part matches the target part
+        self.target = self.states_dict[target_state_str + target_state_str]
 
         return self.state, {"target": self.target}
 
@@ -122,17 +116,16 @@ class BlocksWorldEnvTarget(gym.Env):
             return
         
         if not hasattr(self, 'display') or self.display is None:
-            self.display = Display()
+            self.display = Display(**self.display_options)
         
         if self.display.screen is None:
-            self.display.__init__()  # re-init pygame display
+            self.display.__init__(**self.display_options)  # re-init pygame display
 
         full_state = self.inv_states_dict[self.state]
         agent = full_state[:3]
         target = full_state[3:]
 
         # draw state
-        self.display.draw(agent)
         self.display.target = target
         self.display.step(agent)
 
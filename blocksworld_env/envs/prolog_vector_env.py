@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+import gymnasium as gym
+import numpy as np
+# AutoresetMode needs gymnasium 1.1+, so blocksworld_env.envs does not import this module
+from gymnasium.vector import AutoresetMode
+from gymnasium.vector.utils import batch_space
+
+
+class PrologVectorEnv(gym.vector.VectorEnv):
+    """Vector env over Prolog-backed envs whose queries overlap in a thread pool.
+
+    Each sub-env keeps its own PrologMQI: on/3 is a dynamic predicate, so
+    Prolog threads of one MQI would share (and overwrite) a single blocks
+    configuration. A step sends every sub-env's step/current_state queries
+    from its own pool thread; the threads spend their time blocked on the
+    MQI sockets, where the GIL is released, so the round trips overlap
+    instead of running back to back as in SyncVectorEnv.
+
+    Autoreset follows SyncVectorEnv (next step): the step after an episode
+    ends resets that sub-env and returns its first observation.
+    """
+
+    def __init__(self, env_fns, max_workers=None):
+        self.num_envs = len(env_fns)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or self.num_envs)
+        # Starting swipl dominates construction, so start the sub-envs concurrently too
+        self.envs = list(self.pool.map(lambda fn: fn(), env_fns))
+
+        self.single_observation_space = self.envs[0].observation_space
+        self.single_action_space = self.envs[0].action_space
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self.metadata = dict(self.envs[0].metadata, autoreset_mode=AutoresetMode.NEXT_STEP)
+        self.render_mode = self.envs[0].render_mode
+        self.spec = self.envs[0].spec
+
+        self._autoreset_envs = np.zeros(self.num_envs, dtype=bool)
+
+    def _reset_env(self, i, seed, options):
+        return self.envs[i].reset(seed=seed, options=options)
+
+    def _step_env(self, i, action):
+        if self._autoreset_envs[i]:
+            obs, info = self.envs[i].reset()
+            return obs, 0, False, False, info
+        return self.envs[i].step(action)
+
+    def reset(self, *, seed=None, options=None):
+        if seed is None:
+            seeds = [None] * self.num_envs
+        elif isinstance(seed, int):
+            seeds = [seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+
+        results = list(self.pool.map(self._reset_env, range(self.num_envs), seeds, [options] * self.num_envs))
+        infos = {}
+        for i, (_, info) in enumerate(results):
+            infos = self._add_info(infos, info, i)
+        self._autoreset_envs[:] = False
+        return np.array([obs for obs, _ in results]), infos
+
+    def step(self, actions):
+        results = list(self.pool.map(self._step_env, range(self.num_envs), np.asarray(actions).tolist()))
+        observations, rewards, terminations, truncations, step_infos = zip(*results)
+
+        infos = {}
+        for i, info in enumerate(step_infos):
+            infos = self._add_info(infos, info, i)
+        terminations = np.array(terminations, dtype=bool)
+        truncations = np.array(truncations, dtype=bool)
+        self._autoreset_envs = terminations | truncations
+        return (
+            np.array(observations),
+            np.array(rewards, dtype=np.float64),
+            terminations,
+            truncations,
+            infos,
+        )
+
+    def render(self):
+        return tuple(env.render() for env in self.envs)
+
+    def close_extras(self, **kwargs):
+        list(self.pool.map(lambda env: env.close(), self.envs))
+        self.pool.shutdown()
+
+
+def make_prolog_vec(env_id, num_envs, max_workers=None, **kwargs):
+    """PrologVectorEnv of `num_envs` gymnasium.make(env_id, **kwargs) sub-envs."""
+    return PrologVectorEnv(
+        [lambda: gym.make(env_id, **kwargs)] * num_envs, max_workers=max_workers
+    )
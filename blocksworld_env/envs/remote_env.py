@@ -0,0 +1,77 @@
+import socket
+import struct
+import gymnasium as gym
+from gymnasium import spaces
+
+# Wire protocol shared with env_server.py. All integers are network byte order.
+#   server -> client on connect: HELLO  (num_states, num_actions)
+#   client -> server:            REQUEST (op, arg)  arg = seed (-1: none) or action
+#   server -> client:            REPLY  (state, reward, terminated, target)
+HELLO = struct.Struct("!II")
+REQUEST = struct.Struct("!Bi")
+REPLY = struct.Struct("!iiBi")
+
+OP_RESET = 1
+OP_STEP = 2
+OP_CLOSE = 3
+
+DEFAULT_SOCKET = "/tmp/blocksworld_env.sock"
+
+
+def recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("Environment server closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+class RemoteEnv(gym.Env):
+    """Gymnasium proxy for a session hosted by env_server.py.
+
+    `address` is a Unix socket path or a (host, port) tuple. Observations,
+    rewards and the {"target": ...} info match the local BlocksWorld envs.
+    """
+
+    metadata = {"render_modes": []}
+
+    def __init__(self, address=DEFAULT_SOCKET, render_mode=None):
+        super().__init__()
+        self.render_mode = render_mode
+        if isinstance(address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.connect(address)
+
+        num_states, num_actions = HELLO.unpack(recv_exact(self.sock, HELLO.size))
+        self.observation_space = spaces.Discrete(num_states)
+        self.action_space = spaces.Discrete(num_actions)
+
+    def _call(self, op, arg):
+        self.sock.sendall(REQUEST.pack(op, arg))
+        return REPLY.unpack(recv_exact(self.sock, REPLY.size))
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        state, _, _, target = self._call(OP_RESET, -1 if seed is None else seed & 0x7FFFFFFF)
+        return state, {"target": target}
+
+    def step(self, action):
+        # The server drops connections that send an out-of-range action
+        if not self.action_space.contains(action):
+            raise ValueError(f"Action {action!r} is not in {self.action_space}")
+        state, reward, terminated, target = self._call(OP_STEP, int(action))
+        return state, reward, bool(terminated), False, {"target": target}
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.sendall(REQUEST.pack(OP_CLOSE, 0))
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
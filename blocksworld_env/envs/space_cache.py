@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+from swiplserver import PrologMQI
+
+# Bump when the on-disk layout or the way the tables are derived changes
+CACHE_VERSION = 3
+
+# states:        every observation as its Prolog state string, indexed by state id
+# agent_states:  the 3-digit block configurations the Prolog side steps through
+# actions:       every action as its Prolog term string, indexed by action id
+# transitions:   (num_states, num_actions) next state id, -1 where the move is impossible
+# state_order:   argsort of `states`, for dict-free lookups (see StateIndex)
+# initial_state: the 3-digit configuration `reset` puts the blocks in
+SpaceData = namedtuple(
+    "SpaceData",
+    ["states", "agent_states", "actions", "transitions", "state_order", "initial_state"],
+)
+
+ARRAYS = ("states", "agent_states", "actions", "transitions", "state_order")
+
+BLOCKS = ("a", "b", "c")
+
+# load_spaces arguments for each registered Prolog-backed env. With
+# `with_target`, observations are agent + target state strings.
+ENV_SPACES = {
+    "blocksworld_env/BlocksWorld-v0": {
+        "rules": "blocks_world",
+        "agent_goal": "state(State)",
+        "with_target": False,
+    },
+    "blocksworld_env/BlocksWorldEnvTarget-v0": {
+        "rules": "blocks_world_with_target",
+        "agent_goal": "state_helper(State)",
+        "with_target": True,
+    },
+}
+
+
+def cache_dir():
+    default = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+        "blocksworld_env",
+    )
+    return os.environ.get("BLOCKSWORLD_CACHE_DIR", default)
+
+
+def cache_key(rules_file, **params):
+    # The key covers the rule file contents, so editing the .pl file invalidates it
+    digest = hashlib.sha256()
+    with open(rules_file, "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    digest.update(str(CACHE_VERSION).encode())
+    name = os.path.splitext(os.path.basename(rules_file))[0]
+    return f"{name}-{digest.hexdigest()[:16]}"
+
+
+def format_action(term):
+    # {'args': ['a', 'b', 'c'], 'functor': 'move'} -> "move(a,b,c)"
+    return f"{term['functor']}({','.join(str(arg) for arg in term['args'])})"
+
+
+def set_state_goal(agent_state):
+    # Prolog goal that replaces the current on/3 facts with `agent_state`
+    facts = ", ".join(
+        f"assert(on({block},{pos},[]))" for block, pos in zip(BLOCKS, agent_state)
+    )
+    return f"retractall(on(_,_,[])), {facts}"
+
+
+def build_spaces(prolog_thread, state_goal="state(State)", agent_goal="state(State)"):
+    """Enumerate states, actions and the full transition table over MQI.
+
+    `prolog_thread` must already have the rule file loaded. The Prolog
+    database is put back in its `reset` configuration afterwards.
+    """
+    states = [item["State"] for item in prolog_thread.query(state_goal)]
+    agent_states = [item["State"] for item in prolog_thread.query(agent_goal)]
+    actions = [format_action(item["A"]) for item in prolog_thread.query("action(A)")]
+    action_ids = {a: i for i, a in enumerate(actions)}
+    agent_ids = {s: i for i, s in enumerate(agent_states)}
+
+    prolog_thread.query("reset.")
+    initial_state = prolog_thread.query("current_state(State)")[0]["State"]
+
+    # One query per configuration: every possible move and where it leads,
+    # using the same poss/1 and on/3 rules as step/1
+    agent_transitions = np.full((len(agent_states), len(actions)), -1, dtype=np.int64)
+    for i, agent_state in enumerate(agent_states):
+        result = prolog_thread.query(
+            f"{set_state_goal(agent_state)}, findall(Act-Next, "
+            "(action(Act), poss([Act]), on(a,A,[Act]), on(b,B,[Act]), on(c,C,[Act]), "
+            "atomics_to_string([A,B,C],Next)), L)"
+        )
+        for pair in result[0]["L"]:
+            act, next_state = pair["args"]
+            agent_transitions[i, action_ids[format_action(act)]] = agent_ids[next_state]
+    prolog_thread.query("reset.")
+
+    # Lift the agent table onto the observation states: the agent part moves,
+    # anything after the first three characters (the target) stays put
+    state_ids = {s: i for i, s in enumerate(states)}
+    agent_of = np.array([agent_ids[s[:3]] for s in states])
+    full_index = np.full((len(agent_states), len(states)), -1, dtype=np.int64)
+    for i, s in enumerate(states):
+        full_index[:, i] = [state_ids.get(a + s[3:], -1) for a in agent_states]
+    moved = agent_transitions[agent_of]
+    transitions = np.where(
+        moved >= 0,
+        full_index[moved, np.arange(len(states))[:, None]],
+        -1,
+    )
+
+    dtype = np.int16 if len(states) < np.iinfo(np.int16).max else np.int32
+    states = np.array(states)
+    return SpaceData(
+        states=states,
+        agent_states=np.array(agent_states),
+        actions=np.array(actions),
+        transitions=transitions.astype(dtype),
+        # intp, the type searchsorted's sorter needs: any other dtype is cast
+        # (copying the whole array) on every StateIndex lookup
+        state_order=np.argsort(states).astype(np.intp),
+        initial_state=initial_state,
+    )
+
+
+class StateIndex:
+    """Read-only state string -> id mapping backed by the cached arrays.
+
+    A binary search over `states` via `state_order` replaces a per-process
+    dict, so envs in many worker processes share the memory-mapped arrays
+    instead of each building its own copy.
+    """
+
+    def __init__(self, states, state_order):
+        self.states = states
+        self.state_order = state_order
+
+    def get(self, state, default=None):
+        i = int(np.searchsorted(self.states, state, sorter=self.state_order))
+        if i < len(self.states) and self.states[self.state_order[i]] == state:
+            return int(self.state_order[i])
+        return default
+
+    def __getitem__(self, state):
+        index = self.get(state)
+        if index is None:
+            raise KeyError(state)
+        return index
+
+    def __contains__(self, state):
+        return self.get(state) is not None
+
+    def __len__(self):
+        return len(self.states)
+
+
+def _read(path):
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ARRAYS
+    }
+    return SpaceData(initial_state=meta["initial_state"], **arrays)
+
+
+def _write(path, data):
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent)
+    try:
+        for name in ARRAYS:
+            np.save(os.path.join(tmp, f"{name}.npy"), getattr(data, name))
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump({"initial_state": data.initial_state}, f)
+        os.rename(tmp, path)
+    except OSError:
+        # Another process published the same key first; theirs is identical
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isdir(path):
+            raise
+
+
+def load_spaces(rules, state_goal="state(State)", agent_goal="state(State)", prolog_thread=None):
+    """Return the SpaceData for `rules` (e.g. "blocks_world"), memory-mapped from the cache.
+
+    On a cache miss the spaces are enumerated through `prolog_thread`, or
+    through a temporary PrologMQI when none is given, and written to disk.
+    The arrays are read-only maps of the cache files, so every process that
+    loads them shares the same physical pages.
+    """
+    rules_file = f"{rules}.pl"
+    path = os.path.join(
+        cache_dir(), cache_key(rules_file, state_goal=state_goal, agent_goal=agent_goal)
+    )
+    if os.path.isdir(path):
+        try:
+            return _read(path)
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(path, ignore_errors=True)
+
+    if prolog_thread is not None:
+        data = build_spaces(prolog_thread, state_goal, agent_goal)
+    else:
+        with PrologMQI() as mqi:
+            with mqi.create_thread() as thread:
+                if not thread.query(f"[{rules}]"):
+                    raise RuntimeError(f"Failed to load {rules_file}")
+                data = build_spaces(thread, state_goal, agent_goal)
+    _write(path, data)
+    return _read(path)
+
+
+def load_env_spaces(env_id):
+    """load_spaces for a registered env id, without constructing the env.
+
+    Call it in a parent process before starting vector env workers: the
+    cache is then built once and every worker just maps it.
+    """
+    spec = ENV_SPACES[env_id]
+    return load_spaces(spec["rules"], agent_goal=spec["agent_goal"])
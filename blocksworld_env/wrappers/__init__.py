@@ -2,3 +2,4 @@ from blocksworld_env.wrappers.clip_reward import ClipReward
 from blocksworld_env.wrappers.discrete_actions import DiscreteActions
 from blocksworld_env.wrappers.reacher_weighted_reward import ReacherRewardWrapper
 from blocksworld_env.wrappers.relative_position import RelativePosition
+from blocksworld_env.wrappers.trajectory_recorder import TrajectoryRecorder, load_trajectories
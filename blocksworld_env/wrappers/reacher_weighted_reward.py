@@ -7,10 +7,12 @@ class ReacherRewardWrapper(gym.Wrapper):
         self.reward_dist_weight = reward_dist_weight
         self.reward_ctrl_weight = reward_ctrl_weight
 
-    def step(self, action):
-        obs, _, terminated, truncated, info = self.env.step(action)
-        reward = (
+    def weighted_reward(self, info):
+        return (
             self.reward_dist_weight * info["reward_dist"]
             + self.reward_ctrl_weight * info["reward_ctrl"]
         )
-        return obs, reward, terminated, truncated, info
+
+    def step(self, action):
+        obs, _, terminated, truncated, info = self.env.step(action)
+        return obs, self.weighted_reward(info), terminated, truncated, info
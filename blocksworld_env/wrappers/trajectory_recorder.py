@@ -0,0 +1,141 @@
+import json
+import os
+from collections import namedtuple
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+COLUMNS = ("states", "actions", "rewards", "targets", "flags")
+
+# flags bits
+FIRST = 1       # first transition of an episode
+TERMINATED = 2
+TRUNCATED = 4
+
+# Memory-mapped columns of a recording, one row per transition. `states` is
+# the observation the action was taken in.
+Trajectories = namedtuple("Trajectories", COLUMNS + ("meta",))
+
+
+def index_dtype(n):
+    # Smallest unsigned integer type that holds 0..n-1
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+class TrajectoryRecorder(gym.Wrapper):
+    """Records (state, action, reward, target, done) of every step to `path`.
+
+    Transitions go into preallocated chunks of `chunk_size` rows, stored with
+    the smallest integer types the Discrete spaces allow (uint8 for
+    BlocksWorld-v0, uint16 for the 14400 target-env states). Full chunks are
+    appended to one raw file per column through a memory map. Rewards must be
+    integers that fit `reward_dtype` (the BlocksWorld rewards fit int8).
+    Load a recording with `load_trajectories(path)`.
+    """
+
+    def __init__(self, env, path, chunk_size=65536, reward_dtype=np.int8):
+        super().__init__(env)
+        if not isinstance(env.observation_space, spaces.Discrete) or not isinstance(
+            env.action_space, spaces.Discrete
+        ):
+            raise ValueError("TrajectoryRecorder needs Discrete observation and action spaces")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.dtypes = {
+            "states": index_dtype(env.observation_space.n),
+            "actions": index_dtype(env.action_space.n),
+            "rewards": np.dtype(reward_dtype),
+            "targets": index_dtype(env.observation_space.n),
+            "flags": np.dtype(np.uint8),
+        }
+        self.chunk = {name: np.zeros(chunk_size, dtype=dtype) for name, dtype in self.dtypes.items()}
+        # Bound views of the chunk columns, so step() does no dict lookups
+        self._states, self._actions, self._rewards, self._targets, self._flags = (
+            self.chunk[name] for name in COLUMNS
+        )
+        self.filled = 0    # rows in the current chunk
+        self.flushed = 0   # rows already on disk
+        self.state = None
+        self.first = False
+
+        os.makedirs(path, exist_ok=True)
+        for name in COLUMNS:
+            open(os.path.join(path, f"{name}.bin"), "wb").close()
+        self._write_meta()
+
+    def _write_meta(self):
+        spec = self.env.spec
+        meta = {
+            "env_id": spec.id if spec is not None else None,
+            "count": self.flushed,
+            "dtypes": {name: dtype.str for name, dtype in self.dtypes.items()},
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+    def reset(self, **kwargs):
+        obs, info = self.env.reset(**kwargs)
+        self.state = obs
+        self.first = True
+        return obs, info
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        i = self.filled
+        self._states[i] = self.state
+        self._actions[i] = action
+        self._rewards[i] = reward
+        self._targets[i] = info.get("target", 0)
+        self._flags[i] = self.first | (terminated << 1) | (truncated << 2)
+        self.first = False
+        self.state = obs
+        self.filled = i + 1
+        if self.filled == self.chunk_size:
+            self.flush()
+        return obs, reward, terminated, truncated, info
+
+    def flush(self):
+        # Grow each column file by the filled rows and copy them in through a memory map
+        n = self.filled
+        if n:
+            for name in COLUMNS:
+                dtype = self.dtypes[name]
+                filename = os.path.join(self.path, f"{name}.bin")
+                with open(filename, "r+b") as f:
+                    f.truncate((self.flushed + n) * dtype.itemsize)
+                out = np.memmap(filename, dtype=dtype, mode="r+", offset=self.flushed * dtype.itemsize, shape=(n,))
+                out[:] = self.chunk[name][:n]
+                out.flush()
+                del out
+            self.flushed += n
+            self.filled = 0
+        self._write_meta()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+def load_trajectories(path):
+    """Read-only memory maps of a TrajectoryRecorder recording."""
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    count = meta["count"]
+    columns = {}
+    for name in COLUMNS:
+        dtype = np.dtype(meta["dtypes"][name])
+        if count:
+            columns[name] = np.memmap(os.path.join(path, f"{name}.bin"), dtype=dtype, mode="r", shape=(count,))
+        else:
+            columns[name] = np.zeros(0, dtype=dtype)
+    return Trajectories(meta=meta, **columns)
+
+
+def episode_bounds(trajectories):
+    """(start, stop) row ranges of the recorded episodes."""
+    starts = np.flatnonzero(trajectories.flags & FIRST)
+    stops = np.append(starts[1:], len(trajectories.flags))
+    return list(zip(starts.tolist(), stops.tolist()))
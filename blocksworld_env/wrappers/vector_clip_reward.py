@@ -0,0 +1,18 @@
+import gymnasium as gym
+import numpy as np
+
+
+class VectorClipReward(gym.vector.VectorRewardWrapper):
+    """ClipReward for vector envs: clips the whole reward batch in one call.
+
+    The returned array is a buffer reused on every step; copy it to keep it.
+    """
+
+    def __init__(self, env, min_reward, max_reward):
+        super().__init__(env)
+        self.min_reward = min_reward
+        self.max_reward = max_reward
+        self._rewards = np.zeros(self.num_envs, dtype=np.float64)
+
+    def rewards(self, rewards):
+        return np.clip(rewards, self.min_reward, self.max_reward, out=self._rewards)
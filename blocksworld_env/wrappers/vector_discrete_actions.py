@@ -0,0 +1,24 @@
+import gymnasium as gym
+from gymnasium.spaces import Discrete
+from gymnasium.vector.utils import batch_space
+import numpy as np
+
+
+class VectorDiscreteActions(gym.vector.VectorActionWrapper):
+    """DiscreteActions for vector envs: one lookup-array gather per batch.
+
+    `disc_to_cont` is stacked into a (n, *action_shape) array once, so a batch
+    of discrete actions maps to continuous ones with a single `np.take`.
+    """
+
+    def __init__(self, env, disc_to_cont):
+        super().__init__(env)
+        self.disc_to_cont = np.asarray(disc_to_cont)
+        self.single_action_space = Discrete(len(self.disc_to_cont))
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self._actions = np.empty(
+            (self.num_envs, *self.disc_to_cont.shape[1:]), dtype=self.disc_to_cont.dtype
+        )
+
+    def actions(self, actions):
+        return np.take(self.disc_to_cont, actions, axis=0, out=self._actions)
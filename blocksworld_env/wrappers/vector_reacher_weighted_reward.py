@@ -0,0 +1,25 @@
+import gymnasium as gym
+import numpy as np
+
+
+class VectorReacherRewardWrapper(gym.vector.VectorWrapper):
+    """ReacherRewardWrapper for vector envs, weighting whole info batches.
+
+    The returned rewards are a buffer reused on every step; copy them to keep them.
+    """
+
+    def __init__(self, env, reward_dist_weight, reward_ctrl_weight):
+        super().__init__(env)
+        self.reward_dist_weight = reward_dist_weight
+        self.reward_ctrl_weight = reward_ctrl_weight
+        self._rewards = np.zeros(self.num_envs, dtype=np.float64)
+        self._ctrl = np.zeros(self.num_envs, dtype=np.float64)
+
+    def weighted_rewards(self, infos):
+        np.multiply(infos["reward_dist"], self.reward_dist_weight, out=self._rewards)
+        np.multiply(infos["reward_ctrl"], self.reward_ctrl_weight, out=self._ctrl)
+        return np.add(self._rewards, self._ctrl, out=self._rewards)
+
+    def step(self, actions):
+        obs, _, terminated, truncated, infos = self.env.step(actions)
+        return obs, self.weighted_rewards(infos), terminated, truncated, infos
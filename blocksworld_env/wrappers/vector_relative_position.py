@@ -0,0 +1,24 @@
+import gymnasium as gym
+from gymnasium.spaces import Box
+from gymnasium.vector.utils import batch_space
+import numpy as np
+
+
+class VectorRelativePosition(gym.vector.VectorObservationWrapper):
+    """RelativePosition for vector envs, written into a preallocated batch.
+
+    The returned array is a buffer reused on every step; copy it to keep it.
+    """
+
+    def __init__(self, env):
+        super().__init__(env)
+        self.single_observation_space = Box(shape=(2,), low=-np.inf, high=np.inf)
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+        self._observations = np.empty(
+            self.observation_space.shape, dtype=self.observation_space.dtype
+        )
+
+    def observations(self, observations):
+        return np.subtract(
+            observations["target"], observations["agent"], out=self._observations
+        )
@@ -0,0 +1,103 @@
+import math
+import numpy as np
+
+
+class ConvergenceMonitor:
+    """Incremental convergence and hopelessness checks for a training run.
+
+    Tracks, at O(1) cost per call:
+      - greedy-policy stability: steps since the greedy action last changed
+      - rolling success rate over the last `window` episodes
+      - an exponential moving average of the Q-value change magnitude
+
+    `should_stop()` returns "converged" once the success rate is at least
+    `success_rate`, the greedy policy has been stable for `stable_steps`
+    and the Q-change average is below `q_tol`. It returns "hopeless" when
+    the success rate is still below `min_success_rate` after
+    `give_up_after` episodes. Success means `terminated`, so the env needs
+    a TimeLimit (`max_episode_steps`) for failures to show up at all, and
+    `window` must be smaller than the episode budget. If `evaluate` is
+    given it is called when the convergence criteria are met; a falsy
+    result keeps training and restarts the stability count.
+    """
+
+    def __init__(self, window=100, success_rate=0.95, stable_steps=5000, q_tol=1e-3,
+                 q_ema=0.01, give_up_after=None, min_success_rate=0.05, evaluate=None):
+        self.window = window
+        self.target_success_rate = success_rate
+        self.stable_steps = stable_steps
+        self.q_tol = q_tol
+        self.q_ema = q_ema
+        self.give_up_after = give_up_after
+        self.min_success_rate = min_success_rate
+        self.evaluate = evaluate
+
+        self.outcomes = np.zeros(window, dtype=bool)
+        self.successes = 0
+        self.episodes = 0
+        self.steps = 0
+        self.steps_since_policy_change = 0
+        self.q_change = math.inf
+        self.stop_reason = None
+
+    def record_step(self, policy_changed, q_delta):
+        # One learning update: did the greedy action change, and by how much did Q move
+        self.record_check(1, policy_changed, q_delta)
+
+    def record_check(self, steps, policy_changed, q_delta):
+        # Aggregate form for learners that are inspected every `steps` steps.
+        # Each call is one sample of the Q-change average, so `q_tol` and
+        # `q_ema` are in the units of whatever `q_delta` the caller reports
+        self.steps += steps
+        if policy_changed:
+            self.steps_since_policy_change = 0
+        else:
+            self.steps_since_policy_change += steps
+        q_delta = abs(q_delta)
+        if math.isinf(self.q_change):
+            self.q_change = q_delta
+        else:
+            self.q_change += self.q_ema * (q_delta - self.q_change)
+
+    def record_episode(self, success):
+        i = self.episodes % self.window
+        self.successes += int(success) - int(self.outcomes[i])
+        self.outcomes[i] = success
+        self.episodes += 1
+
+    @property
+    def success_rate(self):
+        return self.successes / min(max(self.episodes, 1), self.window)
+
+    def should_stop(self):
+        if self.stop_reason is not None:
+            return self.stop_reason
+        full_window = self.episodes >= self.window
+        if (
+            full_window
+            and self.success_rate >= self.target_success_rate
+            and self.steps_since_policy_change >= self.stable_steps
+            and self.q_change <= self.q_tol
+        ):
+            if self.evaluate is None or self.evaluate():
+                self.stop_reason = "converged"
+            else:
+                self.steps_since_policy_change = 0
+        elif (
+            self.give_up_after is not None
+            and self.episodes >= self.give_up_after
+            and full_window
+            and self.success_rate < self.min_success_rate
+        ):
+            self.stop_reason = "hopeless"
+        return self.stop_reason
+
+
+def compute_saved(used, budget):
+    """How much of a fixed training budget an early stop saved."""
+    return {
+        "used": used,
+        "budget": budget,
+        "saved": budget - used,
+        "saved_fraction": (budget - used) / budget if budget else 0.0,
+    }
@@ -0,0 +1,132 @@
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+
+
+class MetricsChannel:
+    """Fixed-capacity ring buffer of per-episode (steps, reward) in shared memory.
+
+    There is a single writer (the training loop) and any number of readers.
+    `push` is O(1) and never blocks; once `capacity` episodes have been pushed
+    the oldest ones are overwritten.
+    """
+
+    FIELDS = ("steps", "reward")
+
+    def __init__(self, capacity=100_000, name=None):
+        self.capacity = capacity
+        size = 8 + capacity * len(self.FIELDS) * 8
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self._count = np.ndarray((1,), dtype=np.int64, buffer=self.shm.buf)
+        self._data = np.ndarray(
+            (capacity, len(self.FIELDS)), dtype=np.float64, buffer=self.shm.buf, offset=8
+        )
+        if name is None:
+            self._count[0] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def push(self, steps, reward):
+        count = self._count[0]
+        self._data[count % self.capacity] = (steps, reward)
+        # Publish the row only after it is written
+        self._count[0] = count + 1
+
+    def snapshot(self):
+        """Return (episode numbers, (n, 2) array of steps/reward) in episode order."""
+        count = int(self._count[0])
+        n = min(count, self.capacity)
+        start = count - n
+        idx = np.arange(start, count) % self.capacity
+        return np.arange(start + 1, count + 1), self._data[idx]
+
+    def close(self):
+        del self._count, self._data
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+def downsample(x, y, max_points):
+    # Average consecutive episodes into at most `max_points` buckets. The
+    # oldest n % k episodes are dropped, never the newest ones.
+    n = len(x)
+    if n <= max_points:
+        return x, y
+    k = math.ceil(n / max_points)
+    m = n // k * k
+    return (
+        x[n - m:].reshape(-1, k).mean(axis=1),
+        y[n - m:].reshape(-1, k, *y.shape[1:]).mean(axis=1),
+    )
+
+
+def run_viewer(name, capacity, title, refresh_interval=0.5, max_points=2000):
+    # Imported here so only the viewer process needs an interactive backend
+    import matplotlib.pyplot as plt
+
+    channel = MetricsChannel(capacity, name=name)
+    fig, ax = plt.subplots(figsize=(16, 9))
+    line, = ax.plot([], [], label="Steps per Episode", color="Blue")
+    line2, = ax.plot([], [], label="Rewards per Episode", color="Green")
+    ax.set_xlabel("Episode")
+    ax.set_ylabel("Steps / Cumulative Rewards")
+    ax.set_title(title, fontsize=12)
+    ax.grid(True)
+    plt.legend()
+    plt.show(block=False)
+
+    seen = -1
+    try:
+        while plt.fignum_exists(fig.number):
+            episodes, data = channel.snapshot()
+            if len(episodes) and episodes[-1] != seen:
+                seen = episodes[-1]
+                x, y = downsample(episodes, data, max_points)
+                line.set_data(x, y[:, 0])
+                line2.set_data(x, y[:, 1])
+                ax.relim()
+                ax.autoscale_view()
+                fig.canvas.draw_idle()
+            plt.pause(refresh_interval)
+    finally:
+        channel.close()
+
+
+class LiveDashboard:
+    """Training metrics channel plus an optional viewer process.
+
+    The training loop only calls `push`; redrawing happens in a separate
+    process at `refresh_interval`, so plotting never slows training down.
+    With `viewer=False` nothing is drawn (e.g. on headless nodes) and
+    another process can still attach to `channel.name`.
+    """
+
+    def __init__(self, title, capacity=100_000, refresh_interval=0.5, max_points=2000, viewer=True):
+        self.channel = MetricsChannel(capacity)
+        self.process = None
+        if viewer:
+            ctx = mp.get_context("spawn")
+            self.process = ctx.Process(
+                target=run_viewer,
+                args=(self.channel.name, capacity, title, refresh_interval, max_points),
+                daemon=True,
+            )
+            self.process.start()
+
+    def push(self, steps, reward):
+        self.channel.push(steps, reward)
+
+    def close(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+        if self.channel is not None:
+            self.channel.close()
+            self.channel.unlink()
+            self.channel = None
@@ -0,0 +1,195 @@
+import heapq
+import os
+import gymnasium
+import blocksworld_env
+import numpy as np
+from hyperparams import SET1
+from qlearning import decay_epsilon, q_update
+
+
+class TabularModel:
+    """Last observed outcome of every (state, action), stored in flat arrays.
+
+    The BlocksWorld envs are deterministic, so one sample per pair is the
+    exact model. `seen` lists the flat indices of observed pairs for uniform
+    sampling, and `predecessors` maps a state to the pairs that lead into it
+    for prioritized sweeping. Impossible moves leave the state unchanged;
+    those self-loops are not predecessors of anything. `priority` holds the
+    queued TD error of every pair (0: not queued).
+    """
+
+    def __init__(self, numstates, numactions):
+        self.numactions = numactions
+        self.next_state = np.full(numstates * numactions, -1, dtype=np.int64)
+        self.reward = np.zeros(numstates * numactions)
+        self.seen = np.empty(numstates * numactions, dtype=np.int64)
+        self.num_seen = 0
+        self.predecessors = {}
+        self.priority = np.zeros(numstates * numactions)
+
+    def update(self, state, action, reward, next_state):
+        flat = state * self.numactions + action
+        previous = self.next_state[flat]
+        if previous < 0:
+            self.seen[self.num_seen] = flat
+            self.num_seen += 1
+        if previous != next_state:
+            if previous >= 0 and previous != state:
+                self.predecessors[previous].remove(flat)
+            if next_state != state:
+                self.predecessors.setdefault(next_state, []).append(flat)
+        self.next_state[flat] = next_state
+        self.reward[flat] = reward
+
+    def td_errors(self, qtable, flat, gamma):
+        # Vectorized qlearning.q_update TD errors for the flat (state, action) indices
+        states, actions = np.divmod(flat, self.numactions)
+        bootstrap = qtable[self.next_state[flat]].max(axis=1)
+        return states, actions, self.reward[flat] + gamma * bootstrap - qtable[states, actions]
+
+
+def plan_uniform(qtable, model, planning_steps, gamma, alpha, rng):
+    # K updates on uniformly sampled observed pairs in one batch. A pair drawn
+    # twice gets one update, which only matters for tiny models.
+    flat = model.seen[rng.integers(model.num_seen, size=planning_steps)]
+    states, actions, td = model.td_errors(qtable, flat, gamma)
+    qtable[states, actions] += alpha * td
+
+
+def queue_pair(queue, model, flat, error):
+    # At most one live heap entry per pair: push only when its priority rises.
+    # The entry it replaces goes stale and is skipped when popped.
+    if error > model.priority[flat]:
+        model.priority[flat] = error
+        heapq.heappush(queue, (-error, flat))
+
+
+def plan_prioritized(qtable, model, queue, planning_steps, gamma, alpha, theta):
+    # Prioritized sweeping: update the pairs with the largest TD errors, then
+    # queue the predecessors whose TD error the update pushed above theta
+    updates = 0
+    while queue and updates < planning_steps:
+        error, flat = heapq.heappop(queue)
+        if -error != model.priority[flat]:
+            continue  # stale entry
+        model.priority[flat] = 0
+        updates += 1
+        states, actions, td = model.td_errors(qtable, np.array([flat]), gamma)
+        qtable[states, actions] += alpha * td
+
+        preds = model.predecessors.get(int(states[0]))
+        if preds:
+            preds = np.array(preds)
+            _, _, pred_td = model.td_errors(qtable, preds, gamma)
+            errors = np.abs(pred_td)
+            above = errors > theta
+            for p, error in zip(preds[above], errors[above]):
+                queue_pair(queue, model, int(p), float(error))
+
+
+def train_dyna_q(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, planning_steps=10,
+                 prioritized=False, theta=0.1, run_name="dyna", seed=None, dashboard=None,
+                 on_episode=None):
+    """Dyna-Q: Q-learning plus `planning_steps` model-based updates per env step.
+
+    With `prioritized=True` the planning updates follow a priority queue of
+    large TD errors (prioritized sweeping) instead of uniform samples; pairs
+    whose error is at most `theta` are not queued (the rewards are -10/-1/100,
+    so 0.1 ignores only small residuals).
+    `planning_steps=0` is plain Q-learning, the same qlearning.q_update as
+    train_qlearning. `on_episode(qtable)` is called after every episode;
+    returning True stops training early.
+
+    Returns the Q-table and the per-episode step counts.
+    """
+    numstates = env.observation_space.n
+    numactions = env.action_space.n
+    rng = np.random.default_rng(seed)
+    qtable = rng.random((numstates, numactions))
+    model = TabularModel(numstates, numactions)
+    queue = []
+
+    steps_per_episode = []
+    hyperparams_str = (
+        f"Gamma: {gamma}, Epsilon: {epsilon}, Decay: {decay}, Alpha: {alpha}, "
+        f"Planning steps: {planning_steps}, Prioritized: {prioritized}"
+    )
+
+    # Prepare log file and clear previous content
+    os.makedirs("./logs", exist_ok=True)
+    log_filename = f"./logs/training_log_{run_name}.txt"
+    with open(log_filename, "w") as f:
+        f.write("Training Log\n")
+        f.write(f"Hyperparameters: {hyperparams_str}\n\n")
+
+    for i in range(episodes):
+        state, info = env.reset()
+        steps = 0
+        total_reward = 0
+        done = False
+
+        while not done:
+            if env.render_mode == "human":
+                env.render()
+
+            steps += 1
+
+            if rng.random() < epsilon:
+                action = int(rng.integers(numactions))
+            else:
+                action = int(qtable[state].argmax())
+
+            next_state, reward, terminated, truncated, info = env.step(action)
+            done = terminated or truncated
+            total_reward += reward
+
+            # Direct RL update from the real transition
+            td = q_update(qtable, state, action, reward, next_state, gamma, alpha)
+
+            # Model learning and planning
+            model.update(state, action, reward, next_state)
+            if planning_steps:
+                if prioritized:
+                    if abs(td) > theta:
+                        queue_pair(queue, model, state * numactions + action, abs(td))
+                    plan_prioritized(qtable, model, queue, planning_steps, gamma, alpha, theta)
+                else:
+                    plan_uniform(qtable, model, planning_steps, gamma, alpha, rng)
+
+            state = next_state
+
+        # Log episode result
+        with open(log_filename, "a") as f:
+            f.write(f"Episode {i+1}: Steps {steps}, Total Reward {total_reward}\n")
+
+        # Decay epsilon exponentially
+        epsilon = decay_epsilon(epsilon, epsilon_min, decay)
+
+        steps_per_episode.append(steps)
+        if dashboard is not None:
+            dashboard.push(steps, total_reward)
+        if on_episode is not None and on_episode(qtable):
+            break
+
+    return qtable, steps_per_episode
+
+
+# The 6-digit env includes the target in the observation, so a tabular policy can solve it
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+PLANNING_STEPS = 20
+PRIORITIZED = False
+
+
+def main():
+    env = gymnasium.make(ENV_ID, render_mode=None)
+    try:
+        qtable, steps = train_dyna_q(
+            env, **SET1, planning_steps=PLANNING_STEPS, prioritized=PRIORITIZED, run_name="dyna_q"
+        )
+        print(f"Training complete ✅ {sum(steps)} real env steps over {len(steps)} episodes.")
+    finally:
+        env.close()
+
+
+if __name__ == "__main__":
+    main()
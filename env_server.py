@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import os
+import numpy as np
+from blocksworld_env.envs.space_cache import ENV_SPACES, StateIndex, load_env_spaces
+from blocksworld_env.envs.remote_env import (
+    DEFAULT_SOCKET, HELLO, REQUEST, REPLY, OP_RESET, OP_STEP,
+)
+
+class SessionPool:
+    """Episode state for many sessions, stepped in batches through the transition table.
+
+    Same dynamics and rewards as the Prolog-backed envs: -10 for an impossible
+    move (state unchanged), 100 for reaching the target, -1 otherwise.
+    """
+
+    def __init__(self, spaces_data, with_target, capacity=1024):
+        self.transitions = np.asarray(spaces_data.transitions)
+        self.with_target = with_target
+        self.state_ids = StateIndex(spaces_data.states, spaces_data.state_order)
+        self.initial_state = spaces_data.initial_state
+        self.agent_states = spaces_data.agent_states.tolist()
+        self.num_states, self.num_actions = self.transitions.shape
+
+        self.states = np.zeros(capacity, dtype=np.int64)
+        self.targets = np.zeros(capacity, dtype=np.int64)
+        self.rngs = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def open(self):
+        if not self.free:
+            self._grow()
+        sid = self.free.pop()
+        self.rngs[sid] = np.random.default_rng()
+        return sid
+
+    def _grow(self):
+        capacity = len(self.states)
+        self.states = np.concatenate([self.states, np.zeros(capacity, dtype=np.int64)])
+        self.targets = np.concatenate([self.targets, np.zeros(capacity, dtype=np.int64)])
+        self.rngs.extend([None] * capacity)
+        self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def close(self, sid):
+        self.rngs[sid] = None
+        self.free.append(sid)
+
+    def reset(self, sid, seed):
+        if seed >= 0:
+            self.rngs[sid] = np.random.default_rng(seed)
+        rng = self.rngs[sid]
+        if self.with_target:
+            # Mirrors BlocksWorldEnvTarget.reset
+            target = self.agent_states[rng.integers(len(self.agent_states))]
+            self.states[sid] = self.state_ids[self.initial_state + target]
+            self.targets[sid] = self.state_ids[target + target]
+        else:
+            self.states[sid] = self.state_ids[self.initial_state]
+            self.targets[sid] = rng.integers(self.num_states)
+        return int(self.states[sid]), int(self.targets[sid])
+
+    def step_batch(self, sids, actions):
+        current = self.states[sids]
+        nxt = self.transitions[current, actions]
+        valid = nxt >= 0
+        new = np.where(valid, nxt, current)
+        self.states[sids] = new
+        targets = self.targets[sids]
+        terminated = valid & (new == targets)
+        rewards = np.where(valid, np.where(terminated, 100, -1), -10)
+        return new, rewards, terminated, targets
+
+
+class EnvServer:
+    """Hosts one SessionPool session per connection and coalesces steps.
+
+    Steps that arrive in the same event-loop iteration are gathered and run as
+    a single NumPy batch before any reply is written.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.pending = []
+
+    def _submit_step(self, sid, action):
+        future = asyncio.get_running_loop().create_future()
+        if not self.pending:
+            # Runs after every handler already woken in this iteration
+            asyncio.get_running_loop().call_soon(self._flush)
+        self.pending.append((sid, action, future))
+        return future
+
+    def _flush(self):
+        batch, self.pending = self.pending, []
+        sids = np.fromiter((sid for sid, _, _ in batch), dtype=np.int64, count=len(batch))
+        actions = np.fromiter((a for _, a, _ in batch), dtype=np.int64, count=len(batch))
+        states, rewards, terminated, targets = self.pool.step_batch(sids, actions)
+        for i, (_, _, future) in enumerate(batch):
+            if not future.cancelled():
+                future.set_result(
+                    REPLY.pack(int(states[i]), int(rewards[i]), bool(terminated[i]), int(targets[i]))
+                )
+
+    async def handle(self, reader, writer):
+        sid = self.pool.open()
+        try:
+            writer.write(HELLO.pack(self.pool.num_states, self.pool.num_actions))
+            while True:
+                op, arg = REQUEST.unpack(await reader.readexactly(REQUEST.size))
+                if op == OP_STEP:
+                    if not 0 <= arg < self.pool.num_actions:
+                        break
+                    writer.write(await self._submit_step(sid, arg))
+                elif op == OP_RESET:
+                    state, target = self.pool.reset(sid, arg)
+                    writer.write(REPLY.pack(state, 0, False, target))
+                else:  # OP_CLOSE or unknown
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.pool.close(sid)
+            writer.close()
+
+    async def serve(self, unix_path=None, host="127.0.0.1", port=None):
+        if port is None:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            server = await asyncio.start_unix_server(self.handle, path=unix_path)
+            print(f"Serving on {unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+            print(f"Serving on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched BlocksWorld environment server")
+    parser.add_argument("--env", choices=sorted(ENV_SPACES), default="blocksworld_env/BlocksWorld-v0")
+    parser.add_argument("--unix", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Serve over TCP instead of --unix")
+    args = parser.parse_args()
+
+    pool = SessionPool(load_env_spaces(args.env), ENV_SPACES[args.env]["with_target"])
+    try:
+        asyncio.run(EnvServer(pool).serve(args.unix, args.host, args.port))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
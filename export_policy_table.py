@@ -0,0 +1,52 @@
+import argparse
+import numpy as np
+import torch
+from stable_baselines3 import DQN, PPO
+from table_policy import MODELS
+
+
+def export_policy_table(model, path):
+    # Every observation of the Discrete space in one batch
+    obs = np.arange(model.observation_space.n)
+    obs_tensor, _ = model.policy.obs_to_tensor(obs)
+    with torch.no_grad():
+        if isinstance(model, DQN):
+            kind = "q"
+            values = model.q_net(obs_tensor)
+        else:
+            kind = "logits"
+            values = model.policy.get_distribution(obs_tensor).distribution.logits
+    values = values.cpu().numpy().astype(np.float32)
+
+    num_actions = values.shape[1]
+    action_dtype = np.uint8 if num_actions <= np.iinfo(np.uint8).max + 1 else np.uint16
+    np.savez(
+        path,
+        actions=values.argmax(axis=1).astype(action_dtype),
+        values=values,
+        kind=np.array(kind),
+        exploration_rate=np.array(getattr(model, "exploration_rate", 0.0)),
+    )
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export saved SB3 models to lookup tables")
+    parser.add_argument("models", nargs="*", choices=sorted(MODELS), default=sorted(MODELS))
+    args = parser.parse_args()
+
+    for name in args.models:
+        model_path, table_path = MODELS[name]
+        model = (DQN if name == "dqn" else PPO).load(model_path, device="cpu")
+        export_policy_table(model, table_path)
+
+        # The table must agree with the model's own greedy choice
+        obs = np.arange(model.observation_space.n)
+        expected, _ = model.predict(obs, deterministic=True)
+        actions = np.load(table_path)["actions"]
+        mismatches = int((actions != expected).sum())
+        print(f"✅ Exported {model_path} -> {table_path} ({mismatches} greedy mismatches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 import os
+import numpy as np
+import torch
 from stable_baselines3.common.callbacks import BaseCallback
+from convergence import compute_saved
 
 # Custom callback to log episode statistics
 class EpisodeLoggerCallback(BaseCallback):
-    def __init__(self, log_path, verbose=0):
+    def __init__(self, log_path, verbose=0, dashboard=None):
         super().__init__(verbose)
         self.log_path = log_path
+        self.dashboard = dashboard  # optional dashboard.LiveDashboard
         os.makedirs(os.path.dirname(log_path), exist_ok=True)
         with open(self.log_path, "w") as f:
             f.write("Episode\tSteps\tReward\n")  
@@ -17,6 +21,65 @@ class EpisodeLoggerCallback(BaseCallback):
                 ep_info = info["episode"]
                 with open(self.log_path, "a") as f:
                     f.write(f"{self.num_timesteps}\t{ep_info['l']}\t{ep_info['r']}\n")
+                if self.dashboard is not None:
+                    self.dashboard.push(ep_info['l'], ep_info['r'])
                 if self.verbose > 0:
                     print(f"Episode ended: TimeSteps={ep_info['l']} reward={ep_info['r']}")
-        return True
\ No newline at end of file
+        return True
+
+# Stops training once a convergence.ConvergenceMonitor says the run has
+# converged or is hopeless. Meant to run alongside EpisodeLoggerCallback.
+# Every check_freq steps the monitor gets one sample: the RMS change of the
+# whole value table since the last check, so size its q_tol/q_ema for that
+# rather than for a per-step |dQ|.
+class ConvergenceCallback(BaseCallback):
+    def __init__(self, monitor, check_freq=1000, verbose=0):
+        super().__init__(verbose)
+        self.monitor = monitor
+        self.check_freq = check_freq
+        self.all_obs = None
+        self.last_greedy = None
+        self.last_values = None
+        self.total_timesteps = None
+
+    def _on_training_start(self) -> None:
+        self.total_timesteps = self.locals.get("total_timesteps")
+        # Discrete observation spaces are small enough to inspect in full
+        self.all_obs = np.arange(self.model.observation_space.n)
+
+    def _greedy_and_values(self):
+        obs_tensor, _ = self.model.policy.obs_to_tensor(self.all_obs)
+        with torch.no_grad():
+            if hasattr(self.model, "q_net"):
+                values = self.model.q_net(obs_tensor)
+            else:
+                values = self.model.policy.get_distribution(obs_tensor).distribution.logits
+        values = values.cpu().numpy()
+        return values.argmax(axis=1), values
+
+    def _on_step(self) -> bool:
+        for done, info in zip(self.locals.get("dones", []), self.locals.get("infos", [])):
+            if done:
+                self.monitor.record_episode(not info.get("TimeLimit.truncated", False))
+
+        # The full-table check every check_freq steps keeps the per-step cost O(1)
+        if self.n_calls % self.check_freq == 0:
+            greedy, values = self._greedy_and_values()
+            if self.last_greedy is not None:
+                self.monitor.record_check(
+                    self.check_freq,
+                    bool((greedy != self.last_greedy).any()),
+                    float(np.linalg.norm(values - self.last_values) / np.sqrt(values.size)),
+                )
+            self.last_greedy, self.last_values = greedy, values
+
+            reason = self.monitor.should_stop()
+            if reason:
+                if self.verbose > 0:
+                    saved = compute_saved(self.num_timesteps, self.total_timesteps)
+                    print(
+                        f"Stopped early ({reason}) at {self.num_timesteps} timesteps, "
+                        f"saved {saved['saved']} ({saved['saved_fraction']:.0%})"
+                    )
+                return False
+        return True
@@ -0,0 +1,57 @@
+# Hyperparameters shared by the training scripts, the other trainers and the
+# benchmarks, without importing the scripts themselves (matplotlib, dashboard,
+# or training on import)
+
+# Tabular Q-learning sets
+SET1 = {
+    "episodes": 30,  # Number of episodes the agent will train for
+    "gamma": 0.9, # Discount factor for balance between short-term and long-term rewards
+    "epsilon": 0.2, # Epsilon for exploration-exploitation trade-off
+    "epsilon_min": 0.01, # Minimum epsilon value to ensure some exploration
+    "decay": 0.01, # Decay rate for epsilon to reduce exploration over time
+    "alpha": 0.5 # Learning rate for updating Q-values
+}
+SET2 = {
+    "episodes": 30,
+    "gamma": 0.85,         # Lower discounting — more short-term focused
+    "epsilon": 0.3,        # Higher exploration initially
+    "epsilon_min": 0.05,   # Allow more exploration even at the end
+    "decay": 0.02,         # Faster epsilon decay
+    "alpha": 0.6           # More aggressive learning
+}
+
+SET3 = {
+    "episodes": 30,
+    "gamma": 0.99,         # Very long-term focused
+    "epsilon": 0.1,        # More exploitation from the start
+    "epsilon_min": 0.01,   # Still allow some exploration
+    "decay": 0.005,        # Very slow decay
+    "alpha": 0.3           # Conservative learning rate
+}
+
+# DQN settings of python2_dqn.py
+DQN_PARAMS = {
+    "learning_rate": 5e-4,            # Slightly lower LR for more stable updates
+    "buffer_size": 20000,             # Moderate replay buffer
+    "learning_starts": 500,           # Start training after 500 steps
+    "batch_size": 64,                 # Larger batch size for stability
+    "gamma": 0.98,                    # High discount factor (long-term rewards)
+    "train_freq": 1,                  # Train every step for faster learning feedback
+    "target_update_interval": 500,    # Update target network more frequently
+    "exploration_fraction": 0.2,      # Explore for first 20% of training
+    "exploration_final_eps": 0.02,    # Final low epsilon for mostly greedy actions
+    "max_grad_norm": 10,              # Gradient clipping to stabilize training
+}
+
+# PPO settings of python3_ppo.py
+PPO_PARAMS = {
+    "learning_rate": 5e-4,
+    "n_steps": 2048,
+    "batch_size": 64,
+    "n_epochs": 10,
+    "gamma": 0.98,
+    "gae_lambda": 0.95,
+    "clip_range": 0.2,
+    "ent_coef": 0.01,
+    "max_grad_norm": 0.5,
+}
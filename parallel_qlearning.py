@@ -0,0 +1,189 @@
+import os
+import queue
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+import gymnasium
+import blocksworld_env
+from qlearning import decay_epsilon, q_update
+
+
+def _worker(worker_id, shm_name, shape, env_id, episodes, gamma, epsilon, epsilon_min,
+            decay, alpha, seed, stats_queue, stop_event):
+    # Attach to the parent's Q-table; every worker reads and writes it in place
+    shm = shared_memory.SharedMemory(name=shm_name)
+    qtable = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    rng = np.random.default_rng(seed)
+    numactions = shape[1]
+    env = None
+
+    try:
+        # Inside the try, so a worker whose swipl fails to start still sends its sentinel
+        env = gymnasium.make(env_id, render_mode=None)
+        for episode in range(episodes):
+            if stop_event.is_set():
+                break
+            state, info = env.reset(seed=seed + episode)
+            steps = 0
+            total_reward = 0
+            done = False
+
+            while not done:
+                steps += 1
+
+                if rng.random() < epsilon:
+                    action = int(rng.integers(numactions))
+                else:
+                    action = int(qtable[state].argmax())
+
+                next_state, reward, terminated, truncated, info = env.step(action)
+                done = terminated or truncated
+                total_reward += reward
+
+                # Hogwild update: no lock, concurrent writers may occasionally
+                # overwrite each other, which tabular Q-learning tolerates
+                q_update(qtable, state, action, reward, next_state, gamma, alpha)
+
+                state = next_state
+
+            stats_queue.put((worker_id, episode, steps, total_reward))
+
+            # Decay epsilon exponentially
+            epsilon = decay_epsilon(epsilon, epsilon_min, decay)
+    finally:
+        # Sentinel: this worker is finished
+        stats_queue.put((worker_id, None, 0, 0))
+        if env is not None:
+            env.close()
+        del qtable
+        shm.close()
+
+
+def train_parallel_qlearning(env_id, workers, episodes, gamma, epsilon, epsilon_min, decay, alpha,
+                             run_name="parallel", seed=0, on_episode=None, dashboard=None):
+    """Hogwild tabular Q-learning: `workers` processes share one Q-table.
+
+    `episodes` is per worker. `epsilon` is either one starting value for every
+    worker or a sequence with one starting value per worker. `on_episode` is
+    called in the parent with the list of (worker, steps, total_reward) tuples
+    received so far and the live shared Q-table; returning True stops all
+    workers early. Episodes are also
+    pushed to `dashboard` (a dashboard.LiveDashboard) when one is given.
+
+    Returns the final Q-table, that list of episode statistics, and the
+    wall-clock time in seconds.
+    """
+    # Build the env once in the parent so the space cache is warm for the workers
+    probe = gymnasium.make(env_id, render_mode=None)
+    shape = (probe.observation_space.n, probe.action_space.n)
+    probe.close()
+
+    epsilons = list(epsilon) if np.ndim(epsilon) else [epsilon] * workers
+    if len(epsilons) != workers:
+        raise ValueError(f"Expected {workers} epsilon values, got {len(epsilons)}")
+
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+    qtable = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    qtable[:] = np.random.default_rng(seed).random(shape)
+
+    # Spawn rather than fork: each worker starts its own Prolog process
+    ctx = mp.get_context("spawn")
+    stats_queue = ctx.Queue()
+    stop_event = ctx.Event()
+    processes = [
+        ctx.Process(
+            target=_worker,
+            args=(k, shm.name, shape, env_id, episodes, gamma, epsilons[k], epsilon_min,
+                  decay, alpha, seed + 1000 * (k + 1), stats_queue, stop_event),
+            daemon=True,
+        )
+        for k in range(workers)
+    ]
+
+    # Prepare log file and clear previous content
+    os.makedirs("./logs", exist_ok=True)
+    log_filename = f"./logs/training_log_{run_name}.txt"
+    hyperparams_str = (
+        f"Workers: {workers}, Gamma: {gamma}, Epsilon: {epsilon}, Decay: {decay}, Alpha: {alpha}"
+    )
+
+    history = []
+    start = time.perf_counter()
+    try:
+        for p in processes:
+            p.start()
+
+        with open(log_filename, "w") as f:
+            f.write("Training Log\n")
+            f.write(f"Hyperparameters: {hyperparams_str}\n\n")
+
+            finished = 0
+            while finished < workers:
+                try:
+                    worker_id, episode, steps, total_reward = stats_queue.get(timeout=1.0)
+                except queue.Empty:
+                    # A worker that was killed never sends its sentinel
+                    if not any(p.is_alive() for p in processes):
+                        raise RuntimeError("All workers exited without finishing")
+                    continue
+                if episode is None:
+                    finished += 1
+                    continue
+                history.append((worker_id, steps, total_reward))
+                f.write(
+                    f"Episode {len(history)} (worker {worker_id}, #{episode + 1}): "
+                    f"Steps {steps}, Total Reward {total_reward}\n"
+                )
+                if dashboard is not None:
+                    dashboard.push(steps, total_reward)
+                if on_episode is not None and not stop_event.is_set() and on_episode(history, qtable):
+                    stop_event.set()
+
+        elapsed = time.perf_counter() - start
+        for p in processes:
+            p.join()
+        failed = [k for k, p in enumerate(processes) if p.exitcode != 0]
+        if failed:
+            raise RuntimeError(
+                f"Workers {failed} failed (exit codes {[processes[k].exitcode for k in failed]})"
+            )
+        result = qtable.copy()
+    finally:
+        stop_event.set()
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+        del qtable
+        shm.close()
+        shm.unlink()
+
+    return result, history, elapsed
+
+
+# Environment and hyperparameters, mirroring SET1 in python1_rl.py
+ENV_ID = "blocksworld_env/BlocksWorld-v0"
+WORKERS = os.cpu_count() or 1
+PARAMS = {
+    "episodes": 30,  # Episodes per worker
+    "gamma": 0.9,
+    "epsilon": 0.2,
+    "epsilon_min": 0.01,
+    "decay": 0.01,
+    "alpha": 0.5,
+}
+
+
+def main():
+    qtable, history, elapsed = train_parallel_qlearning(
+        ENV_ID, WORKERS, **PARAMS, run_name=f"parallel_{WORKERS}_workers"
+    )
+    updates = sum(steps for _, steps, _ in history)
+    print(
+        f"Training complete ✅ {len(history)} episodes, {updates} updates "
+        f"in {elapsed:.1f}s ({updates / elapsed:.0f} updates/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
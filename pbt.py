@@ -0,0 +1,317 @@
+import os
+import queue
+import shutil
+import time
+import traceback
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+import gymnasium
+import torch
+import blocksworld_env
+from stable_baselines3 import DQN, PPO
+from planner import evaluation_tasks, greedy_score
+from hyperparams import DQN_PARAMS, PPO_PARAMS, SET1, SET2, SET3
+from qlearning import decay_epsilon, q_update
+
+# Hyperparameters explore() may perturb, with the range they are clipped to.
+# Anything else in a member's dict (e.g. the current epsilon) is copied as is.
+RANGES = {
+    "alpha": (0.01, 1.0),
+    "gamma": (0.5, 0.999),
+    "decay": (1e-4, 0.2),
+    "epsilon_min": (0.0, 0.2),
+    "learning_rate": (1e-5, 1e-2),
+    "exploration_final_eps": (0.0, 0.2),
+    "ent_coef": (0.0, 0.1),
+}
+
+# Fixed SB3 settings, from python2_dqn.py / python3_ppo.py; members only vary the RANGES keys
+SB3_ALGOS = {
+    "DQN": (DQN, {k: v for k, v in DQN_PARAMS.items() if k not in RANGES}),
+    "PPO": (PPO, {k: v for k, v in PPO_PARAMS.items() if k not in RANGES}),
+}
+
+MAX_EPISODE_STEPS = 200
+
+
+def _train_tabular(env, qtable, hyperparams, episodes, rng):
+    # Q-learning (qlearning.q_update) on the member's Q-table, a view into shared memory
+    gamma, alpha = hyperparams["gamma"], hyperparams["alpha"]
+    epsilon = hyperparams["epsilon"]
+    numactions = qtable.shape[1]
+    steps = 0
+    for _ in range(episodes):
+        state, info = env.reset(seed=int(rng.integers(2**31)))
+        done = False
+        while not done:
+            steps += 1
+            if rng.random() < epsilon:
+                action = int(rng.integers(numactions))
+            else:
+                action = int(qtable[state].argmax())
+            next_state, reward, terminated, truncated, info = env.step(action)
+            done = terminated or truncated
+            q_update(qtable, state, action, reward, next_state, gamma, alpha)
+            state = next_state
+
+        # Decay epsilon exponentially
+        epsilon = decay_epsilon(epsilon, hyperparams["epsilon_min"], hyperparams["decay"])
+    return steps, dict(hyperparams, epsilon=epsilon)
+
+
+def _train_sb3(env, algo, path, hyperparams, timesteps, seed):
+    # Continue the member's checkpoint (or start it) with its current hyperparameters
+    cls, fixed = SB3_ALGOS[algo]
+    if os.path.exists(path + ".zip"):
+        model = cls.load(path, env=env, **hyperparams)
+        if algo == "DQN" and os.path.exists(path + "_replay.pkl"):
+            model.load_replay_buffer(path + "_replay")
+    else:
+        model = cls("MlpPolicy", env, seed=seed, verbose=0, **fixed, **hyperparams)
+    start = model.num_timesteps
+    model.learn(total_timesteps=timesteps, reset_num_timesteps=False)
+    model.save(path)
+    if algo == "DQN":
+        model.save_replay_buffer(path + "_replay")
+    return model, model.num_timesteps - start
+
+
+def _worker(env_id, algo, shm_name, shape, checkpoint_dir, tasks, results):
+    # Trains whichever member each task names; members are not tied to workers.
+    # Every task gets a result: (member, score, steps, hyperparams, None), or
+    # (member, None, 0, None, traceback) when it failed
+    env = None
+    shm = None
+    try:
+        env = gymnasium.make(env_id, render_mode=None, max_episode_steps=MAX_EPISODE_STEPS)
+        base = env.unwrapped
+        transitions = np.asarray(base.transitions)
+        eval_tasks = evaluation_tasks(base)
+        if algo is None:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            qtables = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        else:
+            torch.set_num_threads(1)  # the members train in parallel, one core each
+    except Exception:
+        results.put((None, None, 0, None, traceback.format_exc()))
+        if env is not None:
+            env.close()
+        return
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            member, hyperparams, budget, seed = task
+            try:
+                if algo is None:
+                    steps, hyperparams = _train_tabular(
+                        env, qtables[member], hyperparams, budget, np.random.default_rng(seed)
+                    )
+                    greedy = qtables[member].argmax(axis=1)
+                else:
+                    path = os.path.join(checkpoint_dir, f"member_{member}")
+                    model, steps = _train_sb3(env, algo, path, hyperparams, budget, seed)
+                    greedy = model.predict(np.arange(len(transitions)), deterministic=True)[0]
+                score = greedy_score(greedy, transitions, eval_tasks)
+            except Exception:
+                results.put((member, None, 0, None, traceback.format_exc()))
+                continue
+            results.put((member, score, steps, hyperparams, None))
+    finally:
+        env.close()
+        if shm is not None:
+            del qtables
+            shm.close()
+
+
+def _collect(results, processes, timeout=1.0):
+    # Next worker result; raises instead of waiting forever on a failed or killed worker
+    while True:
+        try:
+            member, score, steps, hyperparams, error = results.get(timeout=timeout)
+        except queue.Empty:
+            dead = [p.exitcode for p in processes if p.exitcode not in (None, 0)]
+            if dead or not any(p.is_alive() for p in processes):
+                raise RuntimeError(f"PBT worker exited (exit codes {dead}) before returning a result")
+            continue
+        if error is not None:
+            who = "worker setup" if member is None else f"member {member}"
+            raise RuntimeError(f"PBT {who} failed:\n{error}")
+        return member, score, steps, hyperparams
+
+
+def explore(hyperparams, rng, factors=(0.8, 1.2)):
+    # Multiply every tunable hyperparameter by a random factor, within RANGES
+    perturbed = dict(hyperparams)
+    for key, value in hyperparams.items():
+        if key in RANGES:
+            low, high = RANGES[key]
+            perturbed[key] = float(np.clip(value * rng.choice(factors), low, high))
+    return perturbed
+
+
+def run_pbt(population, generations, interval, env_id="blocksworld_env/BlocksWorldEnvTarget-v0",
+            algo=None, workers=None, exploit=True, fraction=0.25, target=None, stop_at_target=False,
+            seed=0, checkpoint_dir="./models/pbt", run_name="pbt"):
+    """Population-based training of tabular Q-learning (`algo=None`) or an SB3 `algo`.
+
+    `population` is one hyperparameter dict per member (SET1-style dicts for
+    the tabular agent, SB3 constructor arguments otherwise). Every
+    generation each member trains for `interval` episodes (tabular) or
+    timesteps (SB3) in a pool of worker processes and is scored by
+    greedy_score. With `exploit`, the bottom `fraction` of the population
+    then copies a random top-`fraction` member's Q-table or checkpoint and a
+    perturbed copy of its hyperparameters. Q-tables live in one shared
+    memory block; SB3 members exchange checkpoint files in `checkpoint_dir`.
+    Scoring needs the target in the observation, so `env_id` must be a
+    BlocksWorldEnvTarget env.
+
+    Returns a dict with the per-generation history, the final scores and
+    hyperparameters, the best member and its Q-table or checkpoint path, and
+    `reached`: (generation, seconds, env steps) when the best score first hit
+    `target`, or None.
+    """
+    rng = np.random.default_rng(seed)
+    population = [dict(hyperparams) for hyperparams in population]
+    for hyperparams in population:
+        hyperparams.pop("episodes", None)
+    size = len(population)
+
+    # Build the env once in the parent so the space cache is warm for the workers
+    probe = gymnasium.make(env_id, render_mode=None)
+    shape = (size, probe.observation_space.n, probe.action_space.n)
+    probe.close()
+
+    shm = None
+    if algo is None:
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        qtables = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        qtables[:] = rng.random(shape)
+    else:
+        if os.path.isdir(checkpoint_dir):
+            shutil.rmtree(checkpoint_dir)
+        os.makedirs(checkpoint_dir)
+
+    # Spawn rather than fork: each worker starts its own Prolog process
+    ctx = mp.get_context("spawn")
+    tasks, results = ctx.Queue(), ctx.Queue()
+    processes = [
+        ctx.Process(
+            target=_worker,
+            args=(env_id, algo, shm.name if shm else None, shape, checkpoint_dir, tasks, results),
+            daemon=True,
+        )
+        for _ in range(min(workers or os.cpu_count() or 1, size))
+    ]
+
+    # Prepare log file and clear previous content
+    os.makedirs("./logs", exist_ok=True)
+    log_filename = f"./logs/training_log_{run_name}.txt"
+
+    scores = np.zeros(size)
+    history = []
+    reached = None
+    total_steps = 0
+    start = time.perf_counter()
+    try:
+        for p in processes:
+            p.start()
+
+        with open(log_filename, "w") as f:
+            f.write("Training Log\n")
+            f.write(f"Population: {size}, Algo: {algo or 'Q-learning'}, Interval: {interval}, "
+                    f"Exploit: {exploit}\n\n")
+
+            for generation in range(generations):
+                for member in range(size):
+                    tasks.put((member, population[member], interval, int(rng.integers(2**31))))
+                for _ in range(size):
+                    member, score, steps, hyperparams = _collect(results, processes)
+                    scores[member] = score
+                    population[member] = hyperparams
+                    total_steps += steps
+
+                elapsed = time.perf_counter() - start
+                best = int(scores.argmax())
+                history.append((generation, elapsed, total_steps, float(scores[best]), best))
+                f.write(
+                    f"Generation {generation + 1}: Best score {scores[best]:.3f} (member {best}), "
+                    f"Mean score {scores.mean():.3f}, Env steps {total_steps}\n"
+                )
+                if target is not None and reached is None and scores[best] >= target:
+                    reached = (generation + 1, elapsed, total_steps)
+                    if stop_at_target:
+                        break
+
+                if exploit and generation < generations - 1:
+                    # Truncation selection: the bottom fraction copies the top fraction
+                    ranked = np.argsort(scores)
+                    cut = max(1, int(size * fraction))
+                    for loser in ranked[:cut]:
+                        winner = int(rng.choice(ranked[-cut:]))
+                        if algo is None:
+                            qtables[loser] = qtables[winner]
+                        else:
+                            for suffix in (".zip", "_replay.pkl"):
+                                src = os.path.join(checkpoint_dir, f"member_{winner}{suffix}")
+                                if os.path.exists(src):
+                                    shutil.copyfile(src, os.path.join(checkpoint_dir, f"member_{loser}{suffix}"))
+                        population[loser] = explore(population[winner], rng)
+                        scores[loser] = scores[winner]
+                        f.write(f"  member {loser} <- member {winner}: {population[loser]}\n")
+
+        for _ in processes:
+            tasks.put(None)
+        for p in processes:
+            p.join()
+
+        best = int(scores.argmax())
+        result = {
+            "history": history,
+            "scores": scores.tolist(),
+            "population": population,
+            "best": best,
+            "reached": reached,
+            "elapsed": time.perf_counter() - start,
+            "env_steps": total_steps,
+        }
+        if algo is None:
+            result["qtable"] = qtables[best].copy()
+        else:
+            result["checkpoint"] = os.path.join(checkpoint_dir, f"member_{best}")
+    finally:
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+        if shm is not None:
+            del qtables
+            shm.close()
+            shm.unlink()
+    return result
+
+
+# Tabular population, seeded from the hand-written sets
+ENV_ID = "blocksworld_env/BlocksWorldEnvTarget-v0"
+POPULATION = 8
+GENERATIONS = 20
+INTERVAL = 50  # Episodes per member between exploit/explore steps
+
+
+def main():
+    rng = np.random.default_rng(0)
+    sets = [SET1, SET2, SET3]
+    population = [explore(sets[i % len(sets)], rng) if i >= len(sets) else sets[i] for i in range(POPULATION)]
+    result = run_pbt(population, GENERATIONS, INTERVAL, env_id=ENV_ID, target=1.0, run_name="pbt")
+    best = result["best"]
+    print(
+        f"Training complete ✅ best score {result['scores'][best]:.3f} after "
+        f"{result['env_steps']} env steps in {result['elapsed']:.1f}s"
+    )
+    print(f"Best hyperparameters: {result['population'][best]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import itertools
+import multiprocessing as mp
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from blocksworld_env.envs.space_cache import ENV_SPACES, StateIndex, load_env_spaces
+
+# Flat arrays of demonstration transitions, in episode order
+Demonstrations = namedtuple("Demonstrations", ["obs", "actions", "rewards", "next_obs", "dones"])
+
+
+def distances_to(transitions, goal):
+    """Fewest moves from every state to `goal` (-1: unreachable), by backward BFS.
+
+    `transitions` is the cached (num_states, num_actions) table, i.e. the
+    state graph of poss/1 and on/3; -1 entries are impossible moves.
+    """
+    transitions = np.asarray(transitions)
+    dist = np.full(len(transitions), -1, dtype=np.int64)
+    dist[goal] = 0
+    frontier = np.array([goal])
+    depth = 0
+    while frontier.size:
+        depth += 1
+        reaches = np.isin(transitions, frontier).any(axis=1)
+        frontier = np.flatnonzero(reaches & (dist < 0))
+        dist[frontier] = depth
+    return dist
+
+
+def plan(transitions, start, goal, dist=None):
+    """Shortest action sequence from `start` to `goal`, or None if unreachable."""
+    transitions = np.asarray(transitions)
+    if dist is None:
+        dist = distances_to(transitions, goal)
+    if dist[start] < 0:
+        return None
+    actions = []
+    state = start
+    while state != goal:
+        nxt = transitions[state]
+        # Any move that gets one step closer is optimal
+        action = int(np.flatnonzero((nxt >= 0) & (dist[nxt] == dist[state] - 1))[0])
+        actions.append(action)
+        state = nxt[action]
+    return actions
+
+
+def task_states(ids, start, target, with_target):
+    # Observation ids of the start and goal for 3-digit configurations
+    if with_target:
+        return ids[start + target], ids[target + target]
+    return ids[start], ids[target]
+
+
+def evaluation_tasks(base):
+    """(start, goal, optimal length) rows, from the reset configuration to every other target.
+
+    `base` is an unwrapped BlocksWorldEnvTarget: the states index its
+    transition table, whose observation includes the target.
+    """
+    transitions = np.asarray(base.transitions)
+    initial = base.spaces.initial_state
+    tasks = []
+    for target in base.agent_states:
+        if target != initial:
+            start, goal = task_states(base.states_dict, initial, target, True)
+            tasks.append((start, goal, distances_to(transitions, goal)[start]))
+    return np.array(tasks)
+
+
+def greedy_lengths(greedy, transitions, tasks):
+    """Moves the greedy policy (one action per state) takes on each of `tasks`.
+
+    0 where it does not reach the goal within twice the longest optimal
+    length. Rolled out through the transition table, so it costs no Prolog
+    queries.
+    """
+    states = tasks[:, 0].copy()
+    goals, lengths = tasks[:, 1], tasks[:, 2]
+    taken = np.zeros(len(tasks), dtype=np.int64)
+    done = np.zeros(len(tasks), dtype=bool)
+    for step in range(1, 2 * int(lengths.max()) + 1):
+        nxt = transitions[states, greedy[states]]
+        states = np.where(~done & (nxt >= 0), nxt, states)
+        reached = ~done & (states == goals)
+        taken[reached] = step
+        done |= reached
+    return taken
+
+
+def greedy_score(greedy, transitions, tasks):
+    """Mean of optimal / actual path length over `tasks` (0 if not reached).
+
+    1.0 means the greedy policy reaches every target along a shortest path.
+    """
+    taken = greedy_lengths(greedy, transitions, tasks)
+    return float(np.where(taken > 0, tasks[:, 2] / np.maximum(taken, 1), 0).mean())
+
+
+def _demonstrations_for(env_id, pairs):
+    spaces = load_env_spaces(env_id)
+    transitions = np.asarray(spaces.transitions)
+    with_target = ENV_SPACES[env_id]["with_target"]
+    ids = StateIndex(spaces.states, spaces.state_order)
+    dist_cache = {}
+    obs, actions, next_obs = [], [], []
+    rewards, dones = [], []
+    for start, target in pairs:
+        start_id, goal_id = task_states(ids, start, target, with_target)
+        if goal_id not in dist_cache:
+            dist_cache[goal_id] = distances_to(transitions, goal_id)
+        state = start_id
+        path = plan(transitions, start_id, goal_id, dist_cache[goal_id]) or []
+        for i, action in enumerate(path):
+            nxt = int(transitions[state, action])
+            done = i == len(path) - 1
+            obs.append(state)
+            actions.append(action)
+            next_obs.append(nxt)
+            rewards.append(100 if done else -1)
+            dones.append(done)
+            state = nxt
+    return obs, actions, rewards, next_obs, dones
+
+
+def generate_demonstrations(env_id, num_pairs, workers=None, seed=0, start=None):
+    """Optimal demonstrations for `num_pairs` sampled (start, target) pairs.
+
+    Starts and targets are drawn uniformly from the 3-digit configurations;
+    pass `start` to fix the start (e.g. the env's reset configuration).
+    Pairs are split across `workers` processes (default: CPU count).
+    """
+    spaces = load_env_spaces(env_id)  # builds the cache once, before the workers
+    agent_states = spaces.agent_states.tolist()
+    rng = np.random.default_rng(seed)
+    starts = rng.choice(agent_states, num_pairs) if start is None else [start] * num_pairs
+    pairs = [(str(s), str(t)) for s, t in zip(starts, rng.choice(agent_states, num_pairs))]
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [pairs[i::workers] for i in range(workers)]
+    # Workers only need NumPy and the cache; fork where possible so training
+    # scripts without a __main__ guard are not re-run in every worker
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        results = list(pool.map(_demonstrations_for, [env_id] * workers, chunks))
+
+    columns = [list(itertools.chain.from_iterable(r[k] for r in results)) for k in range(5)]
+    return Demonstrations(
+        obs=np.array(columns[0], dtype=np.int64),
+        actions=np.array(columns[1], dtype=np.int64),
+        rewards=np.array(columns[2], dtype=np.float32),
+        next_obs=np.array(columns[3], dtype=np.int64),
+        dones=np.array(columns[4], dtype=bool),
+    )
@@ -0,0 +1,49 @@
+import numpy as np
+import torch
+import torch.nn.functional as F
+from stable_baselines3 import DQN
+
+
+def behaviour_clone(model, demos, epochs=10, batch_size=256, learning_rate=1e-3, seed=0):
+    """Supervised warm start of an SB3 DQN/PPO policy on planner demonstrations.
+
+    PPO maximises the log-likelihood of the demonstrated actions. DQN treats
+    its Q-values as logits, which makes the demonstrated action greedy, and
+    then syncs the target network.
+    """
+    policy = model.policy
+    policy.set_training_mode(True)
+    optimizer = torch.optim.Adam(policy.parameters(), lr=learning_rate)
+    obs = torch.as_tensor(demos.obs, device=model.device)
+    actions = torch.as_tensor(demos.actions, device=model.device)
+    rng = np.random.default_rng(seed)
+
+    for _ in range(epochs):
+        for batch in np.array_split(rng.permutation(len(obs)), max(1, len(obs) // batch_size)):
+            batch = torch.as_tensor(batch, device=model.device)
+            if isinstance(model, DQN):
+                loss = F.cross_entropy(model.q_net(obs[batch]), actions[batch])
+            else:
+                _, log_prob, _ = policy.evaluate_actions(obs[batch], actions[batch])
+                loss = -log_prob.mean()
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+
+    policy.set_training_mode(False)
+    if isinstance(model, DQN):
+        model.q_net_target.load_state_dict(model.q_net.state_dict())
+    return float(loss)
+
+
+def prefill_replay_buffer(model, demos):
+    """Add the demonstration transitions to a DQN's replay buffer."""
+    for obs, action, reward, next_obs, done in zip(*demos):
+        model.replay_buffer.add(
+            np.array([obs]),
+            np.array([next_obs]),
+            np.array([action]),
+            np.array([reward]),
+            np.array([done]),
+            [{}],
+        )
@@ -2,31 +2,27 @@ import gymnasium
 import blocksworld_env
 import numpy as np
 import os
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-plt.ion()
-
-def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, run_name="default"):
+# The final plot is drawn off-screen on its own Agg canvas, without pyplot, so the
+# backend of the live viewer process (dashboard.py) is left alone
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from dashboard import LiveDashboard
+from convergence import ConvergenceMonitor, compute_saved
+from hyperparams import SET1, SET2, SET3
+from qlearning import decay_epsilon, q_update
+
+def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, run_name="default", dashboard=None, monitor=None, on_episode=None):
+    # on_episode(qtable) is called after every episode; returning True stops training.
+    # Returns the Q-table.
     # Initialize Q-table
     numstates = env.observation_space.n
     numactions = env.action_space.n
-    qtable = np.random.rand(numstates, numactions).tolist()
+    qtable = np.random.rand(numstates, numactions)
 
-    # Prepare plotting
+    # Episode history for the final plot
     steps_per_episode = []
     rewards_per_episode = []
-    fig, ax = plt.subplots(figsize=(16, 9))
-    line, = ax.plot([], [], label='Steps per Episode', color='Blue')
-    line2, = ax.plot([], [], label='Rewards per Episode', color='Green')
-    ax.set_xlim(0, episodes)
-    ax.set_xlabel('Episode')
-    ax.set_ylabel('Steps / Cumulative Rewards')
-
     hyperparams_str = f"Gamma: {gamma}, Epsilon: {epsilon}, Decay: {decay}, Alpha: {alpha}"
-    ax.set_title(f'Q-Learning on Blocks World for {run_name} using {env.spec.id}', fontsize=12)
-    ax.grid(True)
-    plt.legend()
 
     # Prepare log file and clear previous content
     os.makedirs("./logs", exist_ok=True)
@@ -40,10 +36,9 @@ def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, ru
         steps = 0
         total_reward = 0
         done = False
+        print(f"Episode {i+1} / {episodes}")
 
         while not done:
-            os.system('clear')
-            print(f"Episode {i+1} / {episodes}")
             if env.render_mode == "human":
                 env.render()
 
@@ -52,14 +47,19 @@ def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, ru
             if np.random.uniform() < epsilon:
                 action = env.action_space.sample()
             else:
-                action = qtable[state].index(max(qtable[state]))
+                action = int(qtable[state].argmax())
 
-            next_state, reward, done, truncated, info = env.step(action)
+            next_state, reward, terminated, truncated, info = env.step(action)
+            done = terminated or truncated
             total_reward += reward
 
-            qtable[state][action] = (1 - alpha) * qtable[state][action] + alpha * (
-                reward + gamma * max(qtable[next_state])
-            )
+            if monitor is not None:
+                old_greedy = qtable[state].argmax()
+
+            td = q_update(qtable, state, action, reward, next_state, gamma, alpha)
+
+            if monitor is not None:
+                monitor.record_step(qtable[state].argmax() != old_greedy, alpha * td)
 
             state = next_state
 
@@ -68,26 +68,49 @@ def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, ru
             f.write(f"Episode {i+1}: Steps {steps}, Total Reward {total_reward}\n")
 
         # Decay epsilon exponentially
-        epsilon = max(epsilon_min, epsilon - decay * epsilon)
+        epsilon = decay_epsilon(epsilon, epsilon_min, decay)
 
         steps_per_episode.append(steps)
         rewards_per_episode.append(total_reward)
 
-        # Update plot
-        line.set_xdata(range(1, len(steps_per_episode) + 1))
-        line.set_ydata(steps_per_episode)
-        line2.set_xdata(range(1, len(rewards_per_episode) + 1))
-        line2.set_ydata(rewards_per_episode)
-        ax.relim()
-        ax.autoscale_view()
-        plt.draw()
-        plt.pause(0.01)
-
-    plt.ioff()
-    plt.show(block=False)
+        # Hand the metrics to the live dashboard, if any; it redraws on its own
+        if dashboard is not None:
+            dashboard.push(steps, total_reward)
+
+        # Stop early once the run has converged (or is hopeless)
+        if monitor is not None:
+            monitor.record_episode(terminated)
+            reason = monitor.should_stop()
+            if reason:
+                saved = compute_saved(i + 1, episodes)
+                message = (
+                    f"Stopped early ({reason}) after {i+1} episodes, "
+                    f"saved {saved['saved']} of {episodes} episodes ({saved['saved_fraction']:.0%})"
+                )
+                with open(log_filename, "a") as f:
+                    f.write(message + "\n")
+                print(message)
+                break
+
+        if on_episode is not None and on_episode(qtable):
+            break
+
+    # Plot the whole run once at the end
+    fig = Figure(figsize=(16, 9))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    episode_numbers = range(1, len(steps_per_episode) + 1)
+    ax.plot(episode_numbers, steps_per_episode, label='Steps per Episode', color='Blue')
+    ax.plot(episode_numbers, rewards_per_episode, label='Rewards per Episode', color='Green')
+    ax.set_xlim(0, episodes)
+    ax.set_xlabel('Episode')
+    ax.set_ylabel('Steps / Cumulative Rewards')
+    ax.set_title(f'Q-Learning on Blocks World for {run_name} using {env.spec.id}', fontsize=12)
+    ax.grid(True)
+    ax.legend()
 
     # Adjust plot layout
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the plot
     if not os.path.exists("screenshots"):
@@ -96,51 +119,44 @@ def train_qlearning(env, episodes, gamma, epsilon, epsilon_min, decay, alpha, ru
     filename = f"screenshots/blocksworld_qlearning_for_{run_name}.png"
     fig.savefig(filename)
     print(f"Saved plot to {filename}")
-    plt.close('all')
 
     print("Training complete ✅. Exiting now.")
 
     # Finally close the environment
     env.close()
+    return qtable
 
 # Constant Environments
-ENV_WITH_3_DIGIT_STATE = gymnasium.make("blocksworld_env/BlocksWorld-v0", render_mode="human")
-ENV_WITH_6_DIGIT_STATE = gymnasium.make("blocksworld_env/BlocksWorldEnvTarget-v0", render_mode="human")
-
-ENV = ENV_WITH_3_DIGIT_STATE # To Switch between Environments
-# ENV = ENV_WITH_6_DIGIT_STATE # to use the 6-digit state environment
-
-# Hyperparameter sets
-SET1 = {
-    "episodes": 30,  # Number of episodes the agent will train for
-    "gamma": 0.9, # Discount factor for balance between short-term and long-term rewards
-    "epsilon": 0.2, # Epsilon for exploration-exploitation trade-off
-    "epsilon_min": 0.01, # Minimum epsilon value to ensure some exploration
-    "decay": 0.01, # Decay rate for epsilon to reduce exploration over time
-    "alpha": 0.5 # Learning rate for updating Q-values
-}
-SET2 = {
-    "episodes": 30,
-    "gamma": 0.85,         # Lower discounting — more short-term focused
-    "epsilon": 0.3,        # Higher exploration initially
-    "epsilon_min": 0.05,   # Allow more exploration even at the end
-    "decay": 0.02,         # Faster epsilon decay
-    "alpha": 0.6           # More aggressive learning
-}
-
-SET3 = {
-    "episodes": 30,
-    "gamma": 0.99,         # Very long-term focused
-    "epsilon": 0.1,        # More exploitation from the start
-    "epsilon_min": 0.01,   # Still allow some exploration
-    "decay": 0.005,        # Very slow decay
-    "alpha": 0.3           # Conservative learning rate
-}
+ENV_WITH_3_DIGIT_STATE = "blocksworld_env/BlocksWorld-v0"
+ENV_WITH_6_DIGIT_STATE = "blocksworld_env/BlocksWorldEnvTarget-v0"
+
+ENV_ID = ENV_WITH_3_DIGIT_STATE # To Switch between Environments
+# ENV_ID = ENV_WITH_6_DIGIT_STATE # to use the 6-digit state environment
+
+LIVE_PLOT = True # Set to False on headless nodes
+EARLY_STOP = False # Stop before the episode budget once the Q-table has converged
+MAX_EPISODE_STEPS = 200 # Episode cap with EARLY_STOP, so failed episodes show up as truncated
 
 # Main function to run the training
 def main():
+    env = gymnasium.make(
+        ENV_ID, render_mode="human", max_episode_steps=MAX_EPISODE_STEPS if EARLY_STOP else None
+    )
+    run_name = "DEMO RUN"
+    dashboard = LiveDashboard(
+        f'Q-Learning on Blocks World for {run_name} using {ENV_ID}', viewer=LIVE_PLOT
+    )
     try:
-        train_qlearning(ENV, **SET1, run_name="DEMO RUN")
+        monitor = None
+        if EARLY_STOP:
+            # Sized for SET1's small budget: the window has to fill well before the last episode
+            episodes = SET1["episodes"]
+            monitor = ConvergenceMonitor(
+                window=max(1, episodes // 3),
+                stable_steps=2 * MAX_EPISODE_STEPS,
+                give_up_after=2 * episodes // 3,
+            )
+        train_qlearning(env, **SET1, run_name=run_name, dashboard=dashboard, monitor=monitor)
     except KeyboardInterrupt:
         print("\n[INFO] Training interrupted by user.")
         os._exit(0)
@@ -148,8 +164,9 @@ def main():
         print(f"\n[ERROR] Unexpected exception: {e}")
     finally:
         print("[INFO] Cleaning up...")
+        dashboard.close()
         try:
-            ENV.close()
+            env.close()
             print("[INFO] Environment closed successfully.")
         except Exception as e:
             print(f"[WARN] Failed to close environment: {e}")
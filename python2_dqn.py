@@ -3,36 +3,56 @@ import gymnasium
 import blocksworld_env
 from stable_baselines3 import DQN
 from gymnasium.wrappers import RecordEpisodeStatistics
-from helper_callback import EpisodeLoggerCallback 
+from helper_callback import EpisodeLoggerCallback, ConvergenceCallback
+from convergence import ConvergenceMonitor
+from planner import generate_demonstrations
+from blocksworld_env.envs.space_cache import ENV_SPACES
+from pretrain import behaviour_clone, prefill_replay_buffer
+from hyperparams import DQN_PARAMS
+
+ENV_ID = "blocksworld_env/BlocksWorld-v0"
+WARM_START = False # Behaviour-clone planner demonstrations before model.learn
+DEMO_PAIRS = 2000  # Number of (start, target) demonstrations for the warm start
+EARLY_STOP = False # Stop before total_timesteps once the policy has converged (or is hopeless)
+MAX_EPISODE_STEPS = 200 # Episode cap with EARLY_STOP, so failed episodes show up as truncated
+TOTAL_TIMESTEPS = 30000
+
+# The demonstrated action for a state depends on the target, so behaviour
+# cloning on BlocksWorld-v0 (target not observed) would fit conflicting labels
+if WARM_START and not ENV_SPACES[ENV_ID]["with_target"]:
+    raise SystemExit(f"WARM_START needs the target in the observation: use BlocksWorldEnvTarget-v0, not {ENV_ID}")
 
 # Prepare environment and wrap with episode statistics wrapper
-env = gymnasium.make("blocksworld_env/BlocksWorld-v0", render_mode=None)
+env = gymnasium.make(ENV_ID, render_mode=None, max_episode_steps=MAX_EPISODE_STEPS if EARLY_STOP else None)
 env = RecordEpisodeStatistics(env) 
 
 # Instantiate the model
-model = DQN(
-    "MlpPolicy",
-    env,
-    verbose=2,
-    learning_rate=5e-4,            # Slightly lower LR for more stable updates
-    buffer_size=20000,             # Moderate replay buffer
-    learning_starts=500,           # Start training after 500 steps
-    batch_size=64,                 # Larger batch size for stability
-    gamma=0.98,                    # High discount factor (long-term rewards)
-    train_freq=1,                  # Train every step for faster learning feedback
-    target_update_interval=500,    # Update target network more frequently
-    exploration_fraction=0.2,      # Explore for first 20% of training
-    exploration_final_eps=0.02,    # Final low epsilon for mostly greedy actions
-    max_grad_norm=10,              # Gradient clipping to stabilize training
-)
+model = DQN("MlpPolicy", env, verbose=2, **DQN_PARAMS)
 
 # Create callback instance
 log_path = "./logs/training_log_DQN.txt"
 callback = EpisodeLoggerCallback(log_path, verbose=1)
+if EARLY_STOP:
+    # Sized for TOTAL_TIMESTEPS; q_tol is the RMS change of the whole value
+    # table between two checks (every 1000 steps), not a per-step |dQ|
+    monitor = ConvergenceMonitor(
+        window=50,
+        stable_steps=TOTAL_TIMESTEPS // 6,
+        q_tol=0.25,
+        q_ema=0.3,
+        give_up_after=TOTAL_TIMESTEPS // (2 * MAX_EPISODE_STEPS),
+    )
+    callback = [callback, ConvergenceCallback(monitor, check_freq=1000, verbose=1)]
 
 # Train the model 
 try:
-    model.learn(total_timesteps=30000, callback=callback, log_interval=4)
+    if WARM_START:
+        # Optimal demonstrations from the env's reset configuration
+        demos = generate_demonstrations(ENV_ID, DEMO_PAIRS, start=env.unwrapped.spaces.initial_state)
+        behaviour_clone(model, demos)
+        prefill_replay_buffer(model, demos)
+        print(f"✅ Warm-started from {len(demos.obs)} demonstration steps")
+    model.learn(total_timesteps=TOTAL_TIMESTEPS, callback=callback, log_interval=4)
     print("✅ DQN Model trained successfully!")
 
 # Handle exceptions
@@ -1,9 +1,14 @@
 import gymnasium
 import blocksworld_env
-from stable_baselines3 import DQN
+USE_TABLE_POLICY = False # Set True to use the lookup table from export_policy_table.py (no torch needed)
 env = gymnasium.make("blocksworld_env/BlocksWorld-v0", render_mode="human")
 
-model = DQN.load("./models/dqn_blocksworld", env=env)  # load saved model with environment
+if USE_TABLE_POLICY:
+    from table_policy import TablePolicy
+    model = TablePolicy.load("./models/dqn_blocksworld_table.npz")
+else:
+    from stable_baselines3 import DQN
+    model = DQN.load("./models/dqn_blocksworld", env=env)  # load saved model with environment
 obs, info = env.reset()
 try:
     while True:
@@ -3,35 +3,55 @@ import gymnasium
 import blocksworld_env
 from stable_baselines3 import PPO
 from gymnasium.wrappers import RecordEpisodeStatistics
-from helper_callback import EpisodeLoggerCallback 
+from helper_callback import EpisodeLoggerCallback, ConvergenceCallback
+from convergence import ConvergenceMonitor
+from planner import generate_demonstrations
+from blocksworld_env.envs.space_cache import ENV_SPACES
+from pretrain import behaviour_clone
+from hyperparams import PPO_PARAMS
+
+ENV_ID = "blocksworld_env/BlocksWorld-v0"
+WARM_START = False # Behaviour-clone planner demonstrations before model.learn
+DEMO_PAIRS = 2000  # Number of (start, target) demonstrations for the warm start
+EARLY_STOP = False # Stop before total_timesteps once the policy has converged (or is hopeless)
+MAX_EPISODE_STEPS = 200 # Episode cap with EARLY_STOP, so failed episodes show up as truncated
+TOTAL_TIMESTEPS = 30000
+
+# The demonstrated action for a state depends on the target, so behaviour
+# cloning on BlocksWorld-v0 (target not observed) would fit conflicting labels
+if WARM_START and not ENV_SPACES[ENV_ID]["with_target"]:
+    raise SystemExit(f"WARM_START needs the target in the observation: use BlocksWorldEnvTarget-v0, not {ENV_ID}")
 
 # Prepare environment and wrap with episode statistics wrapper
-env = gymnasium.make("blocksworld_env/BlocksWorld-v0", render_mode=None)
+env = gymnasium.make(ENV_ID, render_mode=None, max_episode_steps=MAX_EPISODE_STEPS if EARLY_STOP else None)
 env = RecordEpisodeStatistics(env) 
 
 # Instantiate the model
-model = PPO(
-    "MlpPolicy",
-    env,
-    verbose=2,
-    learning_rate=5e-4,
-    n_steps=2048,
-    batch_size=64,
-    n_epochs=10,
-    gamma=0.98,
-    gae_lambda=0.95,
-    clip_range=0.2,
-    ent_coef=0.01,
-    max_grad_norm=0.5,
-)
+model = PPO("MlpPolicy", env, verbose=2, **PPO_PARAMS)
 
 # Create callback instance
 log_path = "./logs/training_log_PPO.txt"
 callback = EpisodeLoggerCallback(log_path, verbose=1)
+if EARLY_STOP:
+    # Sized for TOTAL_TIMESTEPS; q_tol is the RMS change of the whole value
+    # table between two checks (every 1000 steps), not a per-step |dQ|
+    monitor = ConvergenceMonitor(
+        window=50,
+        stable_steps=TOTAL_TIMESTEPS // 6,
+        q_tol=0.25,
+        q_ema=0.3,
+        give_up_after=TOTAL_TIMESTEPS // (2 * MAX_EPISODE_STEPS),
+    )
+    callback = [callback, ConvergenceCallback(monitor, check_freq=1000, verbose=1)]
 
 # Train the model 
 try:
-    model.learn(total_timesteps=30000, callback=callback, log_interval=4)
+    if WARM_START:
+        # Optimal demonstrations from the env's reset configuration
+        demos = generate_demonstrations(ENV_ID, DEMO_PAIRS, start=env.unwrapped.spaces.initial_state)
+        behaviour_clone(model, demos)
+        print(f"✅ Warm-started from {len(demos.obs)} demonstration steps")
+    model.learn(total_timesteps=TOTAL_TIMESTEPS, callback=callback, log_interval=4)
     print("✅ PPO Model trained successfully!")
 
 # Handle exceptions
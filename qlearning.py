@@ -0,0 +1,20 @@
+# The one-step tabular Q-learning update shared by every trainer (python1_rl.py,
+# dyna_qlearning.py, parallel_qlearning.py, pbt.py), so "Q-learning" means the
+# same rule whichever script runs it. Kept free of matplotlib and the dashboard.
+
+
+def q_update(qtable, state, action, reward, next_state, gamma, alpha):
+    """Move qtable[state, action] towards reward + gamma * max(qtable[next_state]).
+
+    Updates the NumPy Q-table in place and returns the TD error. As in the
+    original train_qlearning, the target bootstraps from next_state even when
+    the episode terminated there.
+    """
+    td = reward + gamma * qtable[next_state].max() - qtable[state, action]
+    qtable[state, action] += alpha * td
+    return td
+
+
+def decay_epsilon(epsilon, epsilon_min, decay):
+    # Decay epsilon exponentially, down to epsilon_min
+    return max(epsilon_min, epsilon - decay * epsilon)
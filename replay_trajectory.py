@@ -0,0 +1,84 @@
+import argparse
+import numpy as np
+import pygame
+from screen import Display
+from blocksworld_env.envs.space_cache import ENV_SPACES, load_env_spaces
+from blocksworld_env.wrappers.trajectory_recorder import (
+    TERMINATED, TRUNCATED, episode_bounds, load_trajectories,
+)
+
+
+def simulate(transitions, states, actions, targets):
+    # Replays an episode through the cached transition table: next states and
+    # rewards exactly as the Prolog-backed envs produce them
+    states = states.astype(np.int64)
+    targets = targets.astype(np.int64)
+    nxt = transitions[states, actions.astype(np.int64)]
+    valid = nxt >= 0
+    next_states = np.where(valid, nxt, states)
+    rewards = np.where(valid, np.where(next_states == targets, 100, -1), -10)
+    return next_states, rewards
+
+
+def check_episode(transitions, trajectories, start, stop):
+    # Recorded rewards and the following recorded states against the re-simulation
+    states = trajectories.states[start:stop]
+    next_states, rewards = simulate(
+        transitions, states, trajectories.actions[start:stop], trajectories.targets[start:stop]
+    )
+    mismatches = np.flatnonzero(rewards != trajectories.rewards[start:stop])
+    moved = np.flatnonzero(next_states[:-1] != states[1:])
+    return sorted(set(mismatches.tolist()) | set(moved.tolist())), next_states
+
+
+def render_episode(state_strings, trajectories, start, stop, next_states, fps):
+    display = Display()
+    delay = int(1000 / fps)
+    try:
+        for i in range(start, stop):
+            display.target = state_strings[trajectories.targets[i]]
+            display.step(state_strings[trajectories.states[i]])
+            pygame.time.wait(delay)
+        # The state the last action led to is not recorded, only re-simulated
+        display.step(state_strings[next_states[-1]])
+        pygame.time.wait(delay)
+    finally:
+        display.close_window()
+
+
+def describe(trajectories, start, stop):
+    flags = int(trajectories.flags[stop - 1])
+    end = "terminated" if flags & TERMINATED else "truncated" if flags & TRUNCATED else "unfinished"
+    reward = int(trajectories.rewards[start:stop].astype(np.int64).sum())
+    return f"{stop - start} steps, reward {reward}, {end}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay episodes recorded by TrajectoryRecorder")
+    parser.add_argument("path", help="Recording directory")
+    parser.add_argument("--episode", type=int, nargs="*", default=None, help="Episode numbers (default: all)")
+    parser.add_argument("--render", action="store_true", help="Draw the episodes instead of only checking them")
+    parser.add_argument("--fps", type=float, default=4)
+    args = parser.parse_args()
+
+    trajectories = load_trajectories(args.path)
+    env_id = trajectories.meta["env_id"]
+    if env_id not in ENV_SPACES:
+        raise SystemExit(f"Cannot re-simulate {env_id}: only {sorted(ENV_SPACES)} have a transition table")
+    spaces_data = load_env_spaces(env_id)
+    transitions = np.asarray(spaces_data.transitions)
+
+    bounds = episode_bounds(trajectories)
+    selected = range(len(bounds)) if args.episode is None else args.episode
+    print(f"{len(bounds)} episodes, {len(trajectories.flags)} transitions of {env_id}")
+    for episode in selected:
+        start, stop = bounds[episode]
+        mismatches, next_states = check_episode(transitions, trajectories, start, stop)
+        status = "ok" if not mismatches else f"{len(mismatches)} mismatches, first at step {mismatches[0]}"
+        print(f"Episode {episode}: {describe(trajectories, start, stop)} - {status}")
+        if args.render:
+            render_episode(spaces_data.states, trajectories, start, stop, next_states, args.fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,50 @@
 # import the pygame module, so you can use it
+import queue
+import threading
+import time
+import numpy as np
 import pygame
- 
+
+try:
+    import imageio.v2 as imageio  # optional, only needed to record video
+except ImportError:
+    imageio = None
+
+class VideoRecorder():
+    # Encodes frames on a background thread. Frames are dropped rather than
+    # making the caller wait when the encoder falls behind.
+    def __init__(self, path, fps=30, max_queue=256):
+        if imageio is None:
+            raise ImportError("Recording video needs imageio: pip install imageio imageio-ffmpeg")
+        self.writer = imageio.get_writer(path, fps=fps)
+        self.frames = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, frame):
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            # surfarray frames are (width, height, 3)
+            self.writer.append_data(np.ascontiguousarray(frame.transpose(1, 0, 2)))
+        self.writer.close()
+
+    def close(self):
+        self.frames.put(None)
+        self.thread.join()
+
 class Display():
-    def __init__(self):
+    # max_fps caps how often step() actually draws, frame_skip draws only every
+    # n-th call, and record_path streams every drawn frame to a video file
+    def __init__(self, max_fps=None, frame_skip=1, record_path=None, record_fps=30):
      
         # initialize the pygame module
         pygame.init()
@@ -41,6 +83,13 @@ class Display():
         self.initial = ""
         self.target = ""
 
+        self.max_fps = max_fps
+        self.frame_skip = max(1, frame_skip)
+        self.calls = 0
+        self.last_frame = float("-inf")
+        self.drawn = None  # (image, position) of every sprite currently on screen
+        self.recorder = VideoRecorder(record_path, record_fps) if record_path else None
+
     def start(self):
         # main loop
         while self.running:
@@ -48,24 +97,54 @@ class Display():
                 if event.type == pygame.QUIT:
                     self.running = False
 
-    def step(self,state):
+    def sprites(self,state):
+        # (image, position) of the state's blocks (top) and the target's blocks (bottom)
         a_x,a_y,b_x,b_y,c_x,c_y = self.draw(state)
-        self.screen.fill((255,255,255))
-        self.screen.blit(self.a, (self.positions[a_x],self.heights[a_y]))
-        self.screen.blit(self.b, (self.positions[b_x],self.heights[b_y]))
-        self.screen.blit(self.c, (self.positions[c_x],self.heights[c_y]))
-        
-        pygame.draw.line(self.screen,(0,0,0),self.line_begin,self.line_end)
+        t_a_x,t_a_y,t_b_x,t_b_y,t_c_x,t_c_y = self.draw(self.target)
+        return [(self.a, (self.positions[a_x],self.heights[a_y])),
+                (self.b, (self.positions[b_x],self.heights[b_y])),
+                (self.c, (self.positions[c_x],self.heights[c_y])),
+                (self.a, (self.positions[t_a_x],self.heights[t_a_y+3])),
+                (self.b, (self.positions[t_b_x],self.heights[t_b_y+3])),
+                (self.c, (self.positions[t_c_x],self.heights[t_c_y+3]))]
 
-        a_x,a_y,b_x,b_y,c_x,c_y = self.draw(self.target)
-        a_y+=3
-        b_y+=3
-        c_y+=3
-        self.screen.blit(self.a, (self.positions[a_x],self.heights[a_y]))
-        self.screen.blit(self.b, (self.positions[b_x],self.heights[b_y]))
-        self.screen.blit(self.c, (self.positions[c_x],self.heights[c_y]))
+    def step(self,state):
+        # Throttle: skip frames, then cap the frame rate
+        self.calls += 1
+        if self.calls % self.frame_skip:
+            return
+        now = time.perf_counter()
+        if self.max_fps and now - self.last_frame < 1.0 / self.max_fps:
+            return
+        self.last_frame = now
+
+        sprites = self.sprites(state)
+        if self.drawn is None:
+            # First frame: draw everything
+            self.screen.fill((255,255,255))
+            for image, pos in sprites:
+                self.screen.blit(image, pos)
+            pygame.draw.line(self.screen,(0,0,0),self.line_begin,self.line_end)
+            pygame.display.flip()
+        else:
+            # Only erase and redraw the blocks that moved
+            changed = [i for i in range(len(sprites)) if sprites[i] != self.drawn[i]]
+            dirty = []
+            for i in changed:
+                rect = self.drawn[i][0].get_rect(topleft=self.drawn[i][1])
+                self.screen.fill((255,255,255), rect)
+                dirty.append(rect)
+            for i in changed:
+                image, pos = sprites[i]
+                dirty.append(self.screen.blit(image, pos))
+            if dirty:
+                pygame.draw.line(self.screen,(0,0,0),self.line_begin,self.line_end)
+                pygame.display.update(dirty)
+        self.drawn = sprites
+
+        if self.recorder is not None:
+            self.recorder.submit(pygame.surfarray.array3d(self.screen))
 
-        pygame.display.flip()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -134,6 +213,9 @@ class Display():
     
     # Added function to close the window gracefully
     def close_window(self):
+      if self.recorder is not None:
+         self.recorder.close()
+         self.recorder = None
       pygame.quit()
       self.running = False
       self.screen = None
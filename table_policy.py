@@ -0,0 +1,47 @@
+import numpy as np
+
+# Saved SB3 models and the lookup tables export_policy_table.py exports them to
+MODELS = {
+    "dqn": ("./models/dqn_blocksworld", "./models/dqn_blocksworld_table.npz"),
+    "ppo": ("./models/ppo_blocksworld", "./models/ppo_blocksworld_table.npz"),
+}
+
+class TablePolicy:
+    """Torch-free policy backed by a table exported with export_policy_table.py.
+
+    `predict` has the same signature and return value as an SB3 model's, so
+    it can stand in for a DQN/PPO model on the Discrete BlocksWorld envs.
+    """
+
+    def __init__(self, actions, values, kind, exploration_rate=0.0, seed=None):
+        self.actions = actions            # greedy action per observation
+        self.values = values              # Q-values ("q") or logits ("logits"), (n_obs, n_actions)
+        self.kind = kind
+        self.exploration_rate = exploration_rate
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def load(cls, path, seed=None):
+        data = np.load(path)
+        return cls(
+            data["actions"],
+            data["values"],
+            str(data["kind"]),
+            float(data["exploration_rate"]),
+            seed=seed,
+        )
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=False):
+        obs = np.asarray(observation)
+        if deterministic:
+            return self.actions[obs], state
+        if self.kind == "logits":
+            # Gumbel-max: a sample from softmax(logits) for every observation at once
+            logits = self.values[obs]
+            noise = self.rng.gumbel(size=logits.shape).astype(logits.dtype)
+            return np.argmax(logits + noise, axis=-1), state
+        # DQN: epsilon-greedy with the model's final exploration rate
+        actions = self.actions[obs]
+        explore = self.rng.random(obs.shape) < self.exploration_rate
+        random_actions = self.rng.integers(self.values.shape[1], size=obs.shape)
+        return np.where(explore, random_actions, actions), state